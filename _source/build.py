@@ -19,11 +19,21 @@ focused modules:
 import os
 import shutil
 import sys
+import gzip
+import hashlib
 import importlib
 import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 import argparse
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+try:
+    import brotli
+except ImportError:  # optional; --precompress then emits only .gz siblings
+    brotli = None
 
 from config import (
     BASE_PATH,
@@ -31,9 +41,18 @@ from config import (
     DEFAULT_TRANSLATION_V2_PROVIDER,
     get_language_codes,
 )
-from paths import PROJECT_ROOT, POSTS_DIR, LANG_DIRS, STAGING_DIR
+from paths import PROJECT_ROOT, POSTS_DIR, LANG_DIRS, STAGING_DIR, ensure_dirs
 from helpers import _out
-from content_loader import load_post_metadata, save_post_metadata, parse_markdown_post
+from content_loader import (
+    load_post_metadata,
+    save_post_metadata,
+    parse_markdown_post,
+    start_build_clock,
+    configure_markdown_cache,
+    load_cached_post,
+    store_cached_post,
+    PARSED_SOURCES_KEY,
+)
 from cv_parser import load_cv_data
 from seo import generate_sitemap
 from renderer import (
@@ -43,11 +62,8 @@ from renderer import (
     generate_cv_html,
     generate_root_index,
     generate_presentation_html,
+    clear_render_caches,
 )
-from presentation_compiler import compile_presentation_markdown, presentation_document_to_dict
-from presentation_translation import compare_presentation_translation_invariants
-from translation_common import validate_translation
-from translation_v2 import TranslationV2PostOrchestrator
 from translation_v2.console import (
     configure_console,
     log_blank,
@@ -80,8 +96,10 @@ from renderer import (  # noqa: F401
     render_head,
     generate_lang_toggle_html,
     generate_post_card,
+    enrich_post,
 )
 from seo import render_person_jsonld, render_jsonld_script  # noqa: F401
+from paths import MARKDOWN_CACHE_DIR, PARSED_POSTS_DIR, TRANSLATED_POSTS_DIR
 from paths import (  # noqa: F401
     CACHE_DIR,
     STATIC_DIR,
@@ -90,6 +108,9 @@ from paths import (  # noqa: F401
     TRANSLATION_CACHE,
 )
 
+if TYPE_CHECKING:
+    from translation_v2 import TranslationV2PostOrchestrator
+
 
 def normalize_locale(locale: str) -> str:
     """Normalize locale identifiers to lowercase hyphenated form."""
@@ -173,6 +194,45 @@ def _log_translation_v2_debug_context(post_translator: object | None) -> None:
     )
 
 
+def _start_post_translator(
+    provider_name: str, strict: bool
+) -> "TranslationV2PostOrchestrator | None":
+    """Construct the translation orchestrator the first time a build needs it.
+
+    Returns None after logging the error when the runtime cannot start.
+    """
+    from translation_v2 import TranslationV2PostOrchestrator
+
+    try:
+        post_translator = TranslationV2PostOrchestrator(
+            provider_name=provider_name,
+            strict_validation=strict,
+            cache_path=TRANSLATION_CACHE,
+            prompt_version=os.getenv("TRANSLATION_V2_PROMPT_VERSION", "v2"),
+        )
+        _log_translation_v2_debug_context(post_translator)
+        log_block(
+            "Translation system initialized",
+            [
+                ("Provider", provider_name),
+                ("Prompt version", getattr(post_translator, "prompt_version", "unknown")),
+                ("Translation model", getattr(post_translator, "_model_id", "unknown")),
+                ("Critique model", getattr(post_translator, "_critique_model_id", "unknown")),
+                ("Revision model", getattr(post_translator, "_revision_model_id", "unknown")),
+            ],
+        )
+        log_blank()
+    except Exception as e:
+        log_block(
+            "Translation system error",
+            [("Error", str(e)), ("Action", "fix translation issues and retry")],
+            status="error",
+        )
+        log_blank()
+        return None
+    return post_translator
+
+
 def _serialize_about_artifact(about_payload: dict[str, Any]) -> str:
     paragraph_keys = _about_paragraph_keys(about_payload)
     parts = [f"# {str(about_payload.get('title', '')).strip()}"]
@@ -219,7 +279,7 @@ def _deserialize_about_artifact(
 
 
 def _translate_about_to_pt_v2(
-    post_translator: TranslationV2PostOrchestrator,
+    post_translator: "TranslationV2PostOrchestrator",
     about_en: dict[str, Any],
     *,
     force_revision_reason: str | None = None,
@@ -244,7 +304,7 @@ def _translate_about_to_pt_v2(
 
 
 def _translate_cv_to_pt_v2(
-    post_translator: TranslationV2PostOrchestrator,
+    post_translator: "TranslationV2PostOrchestrator",
     cv_data: dict[str, Any],
     *,
     force_revision_reason: str | None = None,
@@ -286,12 +346,98 @@ def _translate_cv_to_pt_v2(
     return translated
 
 
+# Posts are read, hashed and rendered concurrently; results are consumed in
+# file order so logging, manifest updates and output order stay deterministic.
+_PARSE_WORKERS = 8
+_RENDER_WORKERS = 8
+
+
+def _list_post_sources(posts_dir: Path) -> list[Path]:
+    """Sorted ``*.md`` files of ``posts_dir`` from a single scandir pass.
+
+    Hidden files are skipped, as ``glob("*.md")`` did, and ``is_file()``
+    answers from the directory entry without a stat call per file.
+    """
+    try:
+        with os.scandir(posts_dir) as entries:
+            return sorted(
+                [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".md")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+            )
+    except FileNotFoundError:
+        return []
+
+
+def _parse_source_post(
+    md_file: Path, metadata_store: dict[str, Any], incremental: bool
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Parse one source file, reusing its pickled parse when --incremental
+    and the file's content is unchanged since that parse.
+
+    Runs on a parse thread, so the shared manifest is only read: the parse
+    works on a private shallow copy holding just this file's parsed-source
+    signature.  Returns ``(post, manifest_updates)``; build() merges the
+    updates on the main thread with _merge_manifest_updates().
+    """
+    store = dict(metadata_store)
+    signature = metadata_store.get(PARSED_SOURCES_KEY, {}).get(md_file.name)
+    store[PARSED_SOURCES_KEY] = {} if signature is None else {md_file.name: list(signature)}
+
+    post = load_cached_post(md_file, store, PARSED_POSTS_DIR) if incremental else None
+    if post is None:
+        post = parse_markdown_post(md_file, store)
+        if incremental:
+            store_cached_post(md_file, post, store, PARSED_POSTS_DIR)
+
+    updates = {
+        key: value
+        for key, value in store.items()
+        if key != PARSED_SOURCES_KEY and metadata_store.get(key) is not value
+    }
+    new_signature = store[PARSED_SOURCES_KEY].get(md_file.name)
+    if new_signature is not None and new_signature != signature:
+        updates[PARSED_SOURCES_KEY] = {md_file.name: new_signature}
+    return post, updates
+
+
+def _merge_manifest_updates(metadata_store: dict[str, Any], updates: dict[str, Any]) -> None:
+    for key, value in updates.items():
+        if key == PARSED_SOURCES_KEY:
+            metadata_store.setdefault(PARSED_SOURCES_KEY, {}).update(value)
+        else:
+            metadata_store[key] = value
+
+
+def _publication_key(post: dict[str, Any]) -> str:
+    return str(post.get("published_date", post.get("date", "")))
+
+
 def _sorted_posts(posts: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    return sorted(
-        posts,
-        key=lambda post: str(post.get("published_date", post.get("date", ""))),
-        reverse=True,
-    )
+    return sorted(posts, key=_publication_key, reverse=True)
+
+
+def _post_number(post: dict[str, Any], posts: list[dict[str, Any]]) -> int:
+    """1-based position of *post* in the newest-first ordering of *posts*.
+
+    Counted in one pass rather than by sorting: the posts ahead of it are
+    the newer ones plus same-date ones listed earlier (sorted() is stable
+    under reverse=True).  The translation lane asks once per post, so this
+    keeps it linear per call.
+    """
+    slug = post["slug"]
+    position = next(index for index, candidate in enumerate(posts) if candidate["slug"] == slug)
+    key = _publication_key(posts[position])
+    ahead = 0
+    for index, candidate in enumerate(posts):
+        candidate_key = _publication_key(candidate)
+        if candidate_key > key or (candidate_key == key and index < position):
+            ahead += 1
+    return ahead + 1
 
 
 def _is_presentation_post(post: dict[str, Any]) -> bool:
@@ -302,6 +448,10 @@ def validate_presentation_translation(
     source_markdown: str,
     translated_markdown: str,
 ) -> tuple[bool, list[str]]:
+    # Presentation and translation checks import lazily: a build whose posts
+    # are all cached or plain articles never loads them.
+    from presentation_translation import compare_presentation_translation_invariants
+
     issues = compare_presentation_translation_invariants(
         source_markdown,
         translated_markdown,
@@ -310,6 +460,8 @@ def validate_presentation_translation(
 
 
 def compile_markdown_presentation(markdown: str, *, slug: str = "") -> dict[str, Any]:
+    from presentation_compiler import compile_presentation_markdown, presentation_document_to_dict
+
     document = compile_presentation_markdown(markdown)
     payload = presentation_document_to_dict(document)
     payload["slug"] = slug
@@ -329,74 +481,431 @@ def _prepare_presentation_post(post: dict[str, Any]) -> dict[str, Any]:
     return prepared
 
 
-def _write_output_file(relative_path: Path, content: str, staging_dir: Path | None) -> Path:
+# Bump whenever page templates change in a way that the render fingerprint
+# below cannot see (it already covers renderer/config sources and static assets).
+TEMPLATE_VERSION = "v3"
+
+# Namespace inside the sidecar manifest holding one render fingerprint per
+# post output ("en/blog/<slug>.html" -> fingerprint).  Like the translation
+# cache's "__translation_v2__" key, it cannot collide with a real post slug.
+RENDERED_OUTPUTS_KEY = "__rendered_outputs__"
+
+_RENDER_INPUT_MODULES = ("renderer.py", "helpers.py", "config.py", "seo.py")
+
+
+def _template_hash() -> str:
+    """Hash the template-bearing sources by content, so a checkout or touch
+    that leaves them byte-identical does not force every page to re-render."""
+    source_dir = Path(__file__).resolve().parent
+    digest = hashlib.sha256(TEMPLATE_VERSION.encode("utf-8"))
+    for name in _RENDER_INPUT_MODULES:
+        try:
+            digest.update((source_dir / name).read_bytes())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+# Cleared at the start of every build(), so assets edited between two builds
+# in the same process are picked up.
+_render_salt_cache: dict[str, str] = {}
+
+
+def _render_salt() -> str:
+    """Return a per-build fingerprint of everything a post page depends on
+    besides the post itself: the template hash, build year and static assets.
+    Assets are keyed by stat() metadata only, one syscall per file."""
+    if "salt" in _render_salt_cache:
+        return _render_salt_cache["salt"]
+    parts = [_template_hash(), str(datetime.now().year)]
+    if STATIC_DIR.exists():
+        for path in sorted([path for path in STATIC_DIR.rglob("*") if path.is_file()]):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            rel_path = path.relative_to(STATIC_DIR).as_posix()
+            parts.append(f"{rel_path}:{stat.st_mtime_ns}:{stat.st_size}")
+    _render_salt_cache["salt"] = calculate_content_hash("\n".join(parts))
+    return _render_salt_cache["salt"]
+
+
+def _post_render_fingerprint(post: dict[str, Any], *, post_number: int, lang_key: str) -> str:
+    # Underscore keys are renderer memos (e.g. enrich_post's _display), not inputs.
+    inputs = {key: value for key, value in post.items() if not key.startswith("_")}
+    payload = json.dumps(
+        {"lang": lang_key, "post_number": post_number, "post": inputs},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    # Only ever compared against earlier builds' fingerprints, so it does not
+    # need to match the SHA-256 content_hash shared with the translator.
+    digest = hashlib.blake2b(_render_salt().encode("utf-8"), digest_size=16)
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Manifest namespace for --incremental translation reuse: "<lang>/blog/<slug>.html"
+# -> signature of the source post plus translation runtime state it was
+# translated under.  The translated post itself is pickled under
+# TRANSLATED_POSTS_DIR.
+TRANSLATED_POSTS_KEY = "__translated_posts__"
+_TRANSLATION_ENV_PREFIXES = ("TRANSLATION_V2_", "OPENCODE")
+
+
+def _translation_state_salt(provider_name: str) -> str:
+    """Fingerprint everything besides the source post that goes into a post's
+    translation_v2 cache key: provider, model and prompt-version settings, the
+    translation_v2 package (code, prompts, references), the writing-style
+    brief and the revision manifest.  stat() metadata only, like _render_salt().
+
+    The shared translation cache file is deliberately left out.  Every new
+    translation rewrites it, so fingerprinting it would invalidate every
+    post's reuse; a post's own entry only changes when this salt or the post
+    does, and _translation_signature() covers both.
+    """
+    from translation_v2.revision_manifest import REVISION_MANIFEST_PATH
+    from translation_v2.style_loader import STYLE_BRIEF_PATH
+
+    package_dir = Path(__file__).resolve().parent / "translation_v2"
+    inputs = [REVISION_MANIFEST_PATH, STYLE_BRIEF_PATH]
+    inputs.extend(
+        sorted(
+            path
+            for path in package_dir.rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts
+        )
+    )
+    parts = [
+        f"provider={provider_name}",
+        f"prompt_version={os.getenv('TRANSLATION_V2_PROMPT_VERSION', 'v2')}",
+    ]
+    parts.extend(
+        f"{key}={value}"
+        for key, value in sorted(os.environ.items())
+        if key.startswith(_TRANSLATION_ENV_PREFIXES)
+    )
+    for path in inputs:
+        try:
+            stat = path.stat()
+        except OSError:
+            parts.append(f"{path.name}:missing")
+            continue
+        parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+    return calculate_content_hash("\n".join(parts))
+
+
+def _translation_signature(post: dict[str, Any], target_locale: str, salt: str) -> str:
+    inputs = {key: value for key, value in post.items() if not key.startswith("_")}
+    payload = json.dumps(
+        {"target_locale": target_locale, "post": inputs},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    digest = hashlib.blake2b(salt.encode("utf-8"), digest_size=16)
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _reused_translation_path(lang_key: str, slug: str) -> Path:
+    return TRANSLATED_POSTS_DIR / lang_key / f"{slug}.pkl"
+
+
+def _load_reused_translation(
+    reused: dict[str, str], output_key: str, signature: str, *, lang_key: str, slug: str
+) -> dict[str, Any] | None:
+    if reused.get(output_key) != signature:
+        return None
+    try:
+        with open(_reused_translation_path(lang_key, slug), "rb") as f:
+            post = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    return post if isinstance(post, dict) else None
+
+
+def _store_reused_translation(
+    reused: dict[str, str],
+    output_key: str,
+    signature: str,
+    translated_post: dict[str, Any],
+    *,
+    lang_key: str,
+    slug: str,
+) -> None:
+    cache_file = _reused_translation_path(lang_key, slug)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".pkl.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(translated_post, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache_file)
+    except OSError:
+        return  # a cache write failure must never fail the build
+    reused[output_key] = signature
+
+
+def _render_is_current(
+    rendered_outputs: dict[str, str] | None,
+    output_key: str,
+    fingerprint: str,
+    output_path: Path,
+    staging_dir: Path | None,
+    *,
+    precompress: bool = False,
+) -> bool:
+    """True when a live (unstaged) output was produced from identical inputs.
+
+    Staged builds always render: the staging tree starts empty, so skipping
+    would drop the page from the promoted output.
+    """
+    if rendered_outputs is None or staging_dir is not None:
+        return False
+    return (
+        rendered_outputs.get(output_key) == fingerprint
+        and output_path.exists()
+        and all(
+            sibling.exists() for sibling, _ in _compressed_siblings(output_path, precompress)
+        )
+    )
+
+
+# Output parents already created during the current build; cleared by build()
+# because a fresh staging tree invalidates them.
+_created_output_dirs: set[Path] = set()
+
+
+_OUTPUT_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_INPUT_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    # Raw fd write of pre-encoded bytes: skips the TextIOWrapper/encoder layer
+    # write_text() would stack on top of the same syscalls.
+    fd = os.open(path, _OUTPUT_OPEN_FLAGS, 0o666)  # umask applies, as with open()
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+# build(precompress=True) gives every output pre-compressed siblings a web
+# server can hand out as-is (nginx gzip_static/brotli_static).
+_COMPRESSED_SUFFIXES = (".gz", ".br")
+
+
+def _gzip_bytes(data: bytes) -> bytes:
+    # mtime=0 keeps the gzip header, and so the bytes, stable across builds.
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli_bytes(data: bytes) -> bytes:
+    return brotli.compress(data, quality=11)
+
+
+def _compressed_siblings(output_path: Path, precompress: bool) -> list[tuple[Path, Any]]:
+    """Return ``(path, compress)`` pairs for the precompressed copies of an output."""
+    if not precompress:
+        return []
+    siblings = [(output_path.with_name(output_path.name + ".gz"), _gzip_bytes)]
+    if brotli is not None:
+        siblings.append((output_path.with_name(output_path.name + ".br"), _brotli_bytes))
+    return siblings
+
+
+def _remove_stale_siblings(output_path: Path, keep: set[Path]) -> None:
+    """Delete precompressed copies an earlier build left that this one does not write."""
+    for suffix in _COMPRESSED_SUFFIXES:
+        sibling = output_path.with_name(output_path.name + suffix)
+        if sibling not in keep:
+            sibling.unlink(missing_ok=True)
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write ``data`` unless ``path`` already holds exactly those bytes.
+
+    Leaving byte-identical outputs untouched keeps their mtime (and anything
+    downstream keyed on it: rsync, CDN etags, git) stable.
+    """
+    try:
+        fd = os.open(path, _INPUT_OPEN_FLAGS)
+    except OSError:
+        pass
+    else:
+        # One open/fstat/read/close instead of stat() plus read_bytes(); a
+        # short read only means an unneeded rewrite, never a skipped one.
+        try:
+            unchanged = os.fstat(fd).st_size == len(data) and os.read(fd, len(data)) == data
+        finally:
+            os.close(fd)
+        if unchanged:
+            return False
+    _write_bytes(path, data)
+    return True
+
+
+def _write_output_file(
+    relative_path: Path,
+    content: str,
+    staging_dir: Path | None,
+    *,
+    precompress: bool = False,
+) -> bool:
+    """Write one HTML/XML output; False when it already held these exact bytes.
+
+    With ``precompress`` the output's .gz (and .br) siblings are kept in step;
+    without it, siblings left by an earlier --precompress build are removed so
+    a server never hands out a stale copy.
+    """
     output_path = _out(relative_path, staging_dir)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content, encoding="utf-8")
-    return output_path
+    if output_path.parent not in _created_output_dirs:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _created_output_dirs.add(output_path.parent)
+    data = content.encode("utf-8")
+    changed = _write_if_changed(output_path, data)
+    siblings = _compressed_siblings(output_path, precompress)
+    for sibling, compress in siblings:
+        if changed or not sibling.exists():
+            _write_if_changed(sibling, compress(data))
+    if len(siblings) < len(_COMPRESSED_SUFFIXES):
+        _remove_stale_siblings(output_path, {sibling for sibling, _ in siblings})
+    return changed
+
+
+def _post_output_target(lang_key: str, slug: str) -> tuple[Path, str]:
+    """Return a post page's live output path and its manifest key
+    (``"<lang>/blog/<slug>.html"``), joined in one Path operation."""
+    relative = f"blog/{slug}.html"
+    return LANG_DIRS[lang_key] / relative, f"{lang_key}/{relative}"
 
 
 def _live_output_exists(output_path: Path) -> bool:
     return output_path.exists()
 
 
-def _commit_source_post_output(
+def _render_source_post_output(
     post: dict[str, Any],
     *,
     lang_key: str,
     posts_for_lang: list[dict[str, Any]],
     staging_dir: Path | None,
-) -> None:
-    sorted_posts = _sorted_posts(posts_for_lang)
-    post_number = next(
-        index
-        for index, candidate in enumerate(sorted_posts, start=1)
-        if candidate["slug"] == post["slug"]
-    )
+    rendered_outputs: dict[str, str] | None = None,
+    post_number: int | None = None,
+    precompress: bool = False,
+) -> tuple[str, str | None, bool]:
+    """Render and write one source post page without touching shared state.
+
+    Safe to run on the render pool: ``rendered_outputs`` is only read.
+    Returns ``(output_key, fingerprint, written)`` for
+    _record_source_post_output(); ``fingerprint`` is None when the live page
+    was already current and nothing was rendered.
+    """
+    # build() passes post_number from its own sorted pass; re-sorting here for
+    # every post would make the source lane O(N^2 log N).
+    if post_number is None:
+        post_number = _post_number(post, posts_for_lang)
+    output_path, output_key = _post_output_target(lang_key, post["slug"])
+    fingerprint = _post_render_fingerprint(post, post_number=post_number, lang_key=lang_key)
+    if _render_is_current(
+        rendered_outputs, output_key, fingerprint, output_path, staging_dir, precompress=precompress
+    ):
+        return output_key, None, False
     if _is_presentation_post(post):
         html = generate_presentation_html(post, post_number, lang=lang_key)
     else:
         html = generate_post_html(post, post_number, lang=lang_key)
-    _write_output_file(
-        LANG_DIRS[lang_key] / "blog" / f"{post['slug']}.html",
-        html,
-        staging_dir,
-    )
+    written = _write_output_file(output_path, html, staging_dir, precompress=precompress)
+    return output_key, fingerprint, written
+
+
+def _record_source_post_output(
+    result: tuple[str, str | None, bool],
+    rendered_outputs: dict[str, str] | None,
+) -> None:
+    """Merge one _render_source_post_output() result and log it (main thread)."""
+    output_key, fingerprint, written = result
+    if fingerprint is not None and rendered_outputs is not None:
+        rendered_outputs[output_key] = fingerprint
+    if not written:
+        log_line(f"unchanged: {output_key}", indent=2)
+        return
     log_line(
-        f"built from source: {lang_key}/blog/{post['slug']}.html",
+        f"built from source: {output_key}",
         indent=2,
         status="success",
     )
 
 
-def _commit_source_about_output(
+def _commit_source_post_output(
+    post: dict[str, Any],
     *,
     lang_key: str,
+    posts_for_lang: list[dict[str, Any]],
     staging_dir: Path | None,
+    rendered_outputs: dict[str, str] | None = None,
+    post_number: int | None = None,
+    precompress: bool = False,
 ) -> None:
+    result = _render_source_post_output(
+        post,
+        lang_key=lang_key,
+        posts_for_lang=posts_for_lang,
+        staging_dir=staging_dir,
+        rendered_outputs=rendered_outputs,
+        post_number=post_number,
+        precompress=precompress,
+    )
+    _record_source_post_output(result, rendered_outputs)
+
+
+def _log_source_output(output_key: str, written: bool) -> None:
+    if not written:
+        log_line(f"unchanged: {output_key}", indent=2)
+        return
+    log_line(f"built from source: {output_key}", indent=2, status="success")
+
+
+def _write_source_about_output(
+    *,
+    lang_key: str,
+    staging_dir: Path | None,
+    precompress: bool = False,
+) -> bool:
     about_html = generate_about_html(lang=lang_key)
-    _write_output_file(LANG_DIRS[lang_key] / "about.html", about_html, staging_dir)
-    log_line(f"built from source: {lang_key}/about.html", indent=2, status="success")
+    return _write_output_file(
+        LANG_DIRS[lang_key] / "about.html", about_html, staging_dir, precompress=precompress
+    )
 
 
-def _commit_source_cv_output(
+def _write_source_cv_output(
     *,
     lang_key: str,
     staging_dir: Path | None,
-) -> None:
+    precompress: bool = False,
+) -> bool:
     cv_html = generate_cv_html(lang=lang_key)
-    _write_output_file(LANG_DIRS[lang_key] / "cv.html", cv_html, staging_dir)
-    log_line(f"built from source: {lang_key}/cv.html", indent=2, status="success")
+    return _write_output_file(
+        LANG_DIRS[lang_key] / "cv.html", cv_html, staging_dir, precompress=precompress
+    )
 
 
 def _commit_translated_about_output(
     about_payload: dict[str, Any],
     *,
     staging_dir: Path | None,
+    precompress: bool = False,
 ) -> None:
     LANGUAGES["pt"]["about"] = dict(about_payload)
     about_html = generate_about_html(lang="pt", translated_about=about_payload)
-    _write_output_file(LANG_DIRS["pt"] / "about.html", about_html, staging_dir)
+    if not _write_output_file(
+        LANG_DIRS["pt"] / "about.html", about_html, staging_dir, precompress=precompress
+    ):
+        log_line("unchanged translation: pt/about.html", indent=2)
+        return
     log_line("committed translation: pt/about.html", indent=2, status="success")
 
 
@@ -404,9 +913,14 @@ def _commit_translated_cv_output(
     cv_payload: dict[str, Any],
     *,
     staging_dir: Path | None,
+    precompress: bool = False,
 ) -> None:
     cv_html = generate_cv_html(lang="pt", translated_cv=cv_payload)
-    _write_output_file(LANG_DIRS["pt"] / "cv.html", cv_html, staging_dir)
+    if not _write_output_file(
+        LANG_DIRS["pt"] / "cv.html", cv_html, staging_dir, precompress=precompress
+    ):
+        log_line("unchanged translation: pt/cv.html", indent=2)
+        return
     log_line("committed translation: pt/cv.html", indent=2, status="success")
 
 
@@ -416,42 +930,83 @@ def _commit_translated_post_output(
     lang_key: str,
     posts_for_lang: list[dict[str, Any]],
     staging_dir: Path | None,
+    rendered_outputs: dict[str, str] | None = None,
+    precompress: bool = False,
 ) -> None:
-    sorted_posts = _sorted_posts(posts_for_lang)
-    post_number = next(
-        index
-        for index, post in enumerate(sorted_posts, start=1)
-        if post["slug"] == translated_post["slug"]
+    post_number = _post_number(translated_post, posts_for_lang)
+    output_path, output_key = _post_output_target(lang_key, translated_post["slug"])
+    fingerprint = _post_render_fingerprint(
+        translated_post, post_number=post_number, lang_key=lang_key
     )
+    if _render_is_current(
+        rendered_outputs, output_key, fingerprint, output_path, staging_dir, precompress=precompress
+    ):
+        log_line(f"unchanged translation: {output_key}", indent=2)
+        return
     if _is_presentation_post(translated_post):
         html = generate_presentation_html(translated_post, post_number, lang=lang_key)
     else:
         html = generate_post_html(translated_post, post_number, lang=lang_key)
-    _write_output_file(
-        LANG_DIRS[lang_key] / "blog" / f"{translated_post['slug']}.html",
-        html,
-        staging_dir,
-    )
+    written = _write_output_file(output_path, html, staging_dir, precompress=precompress)
+    if rendered_outputs is not None:
+        rendered_outputs[output_key] = fingerprint
+    if not written:
+        log_line(f"unchanged translation: {output_key}", indent=2)
+        return
     log_line(
-        f"committed translation: {lang_key}/blog/{translated_post['slug']}.html",
+        f"committed translation: {output_key}",
         indent=2,
         status="success",
     )
 
 
+def _log_listing_output(output_key: str, written: bool, *, source_build: bool) -> None:
+    if not written:
+        log_line(f"unchanged: {output_key}", indent=2)
+    elif source_build:
+        log_line(f"built from source: {output_key}", indent=2, status="success")
+    else:
+        log_line(f"updated translated output: {output_key}", indent=2, status="success")
+
+
+def _write_language_index(
+    *,
+    posts: list[dict[str, Any]],
+    lang_key: str,
+    staging_dir: Path | None,
+    precompress: bool = False,
+) -> bool:
+    index_html = generate_index_html(_sorted_posts(posts), lang=lang_key)
+    return _write_output_file(
+        LANG_DIRS[lang_key] / "index.html", index_html, staging_dir, precompress=precompress
+    )
+
+
+def _write_sitemap_output(
+    *,
+    posts_en: list[dict[str, Any]],
+    posts_pt: list[dict[str, Any]],
+    staging_dir: Path | None,
+    precompress: bool = False,
+) -> bool:
+    sitemap_xml = generate_sitemap(_sorted_posts(posts_en), _sorted_posts(posts_pt))
+    return _write_output_file(
+        PROJECT_ROOT / "sitemap.xml", sitemap_xml, staging_dir, precompress=precompress
+    )
+
+
 def _commit_language_index(
     *,
     posts: list[dict[str, Any]],
     lang_key: str,
     staging_dir: Path | None,
     source_build: bool,
+    precompress: bool = False,
 ) -> None:
-    index_html = generate_index_html(_sorted_posts(posts), lang=lang_key)
-    _write_output_file(LANG_DIRS[lang_key] / "index.html", index_html, staging_dir)
-    if source_build:
-        log_line(f"built from source: {lang_key}/index.html", indent=2, status="success")
-    else:
-        log_line(f"updated translated output: {lang_key}/index.html", indent=2, status="success")
+    written = _write_language_index(
+        posts=posts, lang_key=lang_key, staging_dir=staging_dir, precompress=precompress
+    )
+    _log_listing_output(f"{lang_key}/index.html", written, source_build=source_build)
 
 
 def _commit_sitemap_output(
@@ -460,13 +1015,38 @@ def _commit_sitemap_output(
     posts_pt: list[dict[str, Any]],
     staging_dir: Path | None,
     source_build: bool,
+    precompress: bool = False,
 ) -> None:
-    sitemap_xml = generate_sitemap(_sorted_posts(posts_en), _sorted_posts(posts_pt))
-    _write_output_file(PROJECT_ROOT / "sitemap.xml", sitemap_xml, staging_dir)
-    if source_build:
-        log_line("built from source: sitemap.xml", indent=2, status="success")
-    else:
-        log_line("updated translated output: sitemap.xml", indent=2, status="success")
+    written = _write_sitemap_output(
+        posts_en=posts_en, posts_pt=posts_pt, staging_dir=staging_dir, precompress=precompress
+    )
+    _log_listing_output("sitemap.xml", written, source_build=source_build)
+
+
+def _commit_translated_listings(
+    stale_langs: set[str],
+    rendered_posts_by_lang: dict[str, list[dict[str, Any]]],
+    staging_dir: Path | None,
+    *,
+    precompress: bool = False,
+) -> None:
+    """Re-commit the indexes of ``stale_langs`` and the sitemap, then clear it."""
+    for lang_key in sorted(stale_langs):
+        _commit_language_index(
+            posts=rendered_posts_by_lang[lang_key],
+            lang_key=lang_key,
+            staging_dir=staging_dir,
+            source_build=False,
+            precompress=precompress,
+        )
+    _commit_sitemap_output(
+        posts_en=rendered_posts_by_lang["en"],
+        posts_pt=rendered_posts_by_lang["pt"],
+        staging_dir=staging_dir,
+        source_build=False,
+        precompress=precompress,
+    )
+    stale_langs.clear()
 
 
 def build(
@@ -478,6 +1058,9 @@ def build(
     translation_failure_policy: str | None = None,
     skip_about_cv_translation: bool = False,
     verbose: bool = False,
+    clean_cache: bool = False,
+    incremental: bool = False,
+    precompress: bool = False,
 ):
     """Main build function orchestrating entire site generation.
 
@@ -513,6 +1096,18 @@ def build(
         skip_about_cv_translation (bool): If True, skip about/cv translation API
                                           calls and reuse EN content for PT pages.
         verbose (bool): If True, keep runner-level translation detail visible.
+        clean_cache (bool): If True, wipe the rendered-Markdown cache
+                            (_cache/markdown-html/) before parsing posts.
+        incremental (bool): If True, reuse the pickled parse of every post
+                            whose source file is unchanged
+                            (_cache/parsed-posts/) instead of re-parsing it,
+                            and the last accepted translation of every post
+                            whose source and translation state are unchanged
+                            (_cache/translated-posts/).
+        precompress (bool): If True, write a gzip (and, with the optional
+                            brotli package, a brotli) copy next to every
+                            HTML/XML output for servers that serve
+                            precompressed files.
 
     Returns:
         bool: True if build succeeds, False if validation or translation fails.
@@ -549,6 +1144,7 @@ def build(
 
     # Determine staging directory (None = write directly)
     staging_dir = STAGING_DIR if use_staging else None
+    _created_output_dirs.clear()
 
     # Prepare staging area: clean any previous attempt so stale files don't
     # survive into the new build, then create the skeleton directories.
@@ -580,10 +1176,10 @@ def build(
     # Load and validate CV data before doing any work
     # (load_cv_data() exits with SystemExit if validation fails)
     load_cv_data()
-    post_translator: TranslationV2PostOrchestrator | None = None
+    post_translator: "TranslationV2PostOrchestrator | None" = None
 
     # Get all markdown files
-    md_files = sorted(POSTS_DIR.glob("*.md"))
+    md_files = _list_post_sources(POSTS_DIR)
 
     if not md_files:
         log_block(
@@ -622,6 +1218,10 @@ def build(
     # Load the sidecar metadata manifest once; pass it to every parse call so
     # we can save it a single time at the end (avoids N redundant disk writes).
     metadata_store = load_post_metadata()
+    start_build_clock()
+    _render_salt_cache.clear()
+    clear_render_caches()
+    rendered_outputs = metadata_store.setdefault(RENDERED_OUTPUTS_KEY, {})
 
     # Parse all posts first; source and translated outputs are committed in
     # separate lanes later in the build.
@@ -632,41 +1232,55 @@ def build(
     # Translation quality tracking
     quality_stats = {
         "translated": 0,
+        "reused": 0,  # --incremental posts whose last accepted translation was reused
         "validated_ok": 0,
         "validated_warnings": 0,
         "failed": 0,
         "issues": [],  # (slug, [issues]) pairs for the summary
     }
 
-    for md_file in selected_md_files:
-        try:
-            post_source = parse_markdown_post(md_file, metadata_store)
-            post_source = _prepare_presentation_post(post_source)
-            source_locale = post_source.get("lang", "en-us")
-            source_lang_key = locale_to_lang_key(source_locale)
-            target_locale = get_target_locale(source_locale)
-            target_lang_key = locale_to_lang_key(target_locale)
-
-            parsed_posts.append(
-                {
-                    "md_file": md_file,
-                    "post": post_source,
-                    "source_locale": source_locale,
-                    "source_lang_key": source_lang_key,
-                    "target_locale": target_locale,
-                    "target_lang_key": target_lang_key,
-                }
-            )
-            source_posts_by_lang[source_lang_key].append(post_source)
-            rendered_posts_by_lang[source_lang_key].append(post_source)
-            if verbose:
-                log_line(
-                    f"Parsed {md_file.name} ({source_locale.upper()} -> {target_locale.upper()})",
-                    indent=1,
+    # The rendered-Markdown cache is only active while this build parses posts.
+    configure_markdown_cache(MARKDOWN_CACHE_DIR, clear=clean_cache)
+    try:
+        with ThreadPoolExecutor(max_workers=_PARSE_WORKERS) as parse_pool:
+            parse_futures = [
+                parse_pool.submit(_parse_source_post, md_file, metadata_store, incremental)
+                for md_file in selected_md_files
+            ]
+        for md_file, parse_future in zip(selected_md_files, parse_futures):
+            try:
+                post_source, manifest_updates = parse_future.result()
+                _merge_manifest_updates(metadata_store, manifest_updates)
+                for warning in post_source.get("_warnings", ()):
+                    log_line(f"Warning: {warning}", indent=1)
+                post_source = _prepare_presentation_post(post_source)
+                source_locale = post_source.get("lang", "en-us")
+                source_lang_key = locale_to_lang_key(source_locale)
+                target_locale = get_target_locale(source_locale)
+                target_lang_key = locale_to_lang_key(target_locale)
+
+                parsed_posts.append(
+                    {
+                        "md_file": md_file,
+                        "post": post_source,
+                        "source_locale": source_locale,
+                        "source_lang_key": source_lang_key,
+                        "target_locale": target_locale,
+                        "target_lang_key": target_lang_key,
+                    }
                 )
-        except Exception as e:
-            log_line(f"Error: {e}", indent=1, status="error")
-            return False
+                source_posts_by_lang[source_lang_key].append(post_source)
+                rendered_posts_by_lang[source_lang_key].append(post_source)
+                if verbose:
+                    log_line(
+                        f"Parsed {md_file.name} ({source_locale.upper()} -> {target_locale.upper()})",
+                        indent=1,
+                    )
+            except Exception as e:
+                log_line(f"Error: {e}", indent=1, status="error")
+                return False
+    finally:
+        configure_markdown_cache(None)
 
     # Persist sidecar manifest once after all posts are parsed
     # (_cache/ writes bypass staging -- they are build-time state, not output)
@@ -676,27 +1290,68 @@ def build(
     log_block("Building source outputs")
     log_blank()
 
-    # Commit source-authored posts before any translation work starts.
-    for lang_key in get_language_codes():
-        for post in _sorted_posts(source_posts_by_lang[lang_key]):
-            try:
-                _commit_source_post_output(
+    # Commit source-authored posts before any translation work starts.  Each
+    # page is an independent render + write, so they run on a small pool.
+    # Workers only read shared state: display memos are filled here first,
+    # and results are logged and merged into rendered_outputs on this thread
+    # in submission order, so the first failure is the one reported, as with
+    # the sequential loop.
+    source_jobs = [
+        (lang_key, post_number, post)
+        for lang_key in get_language_codes()
+        for post_number, post in enumerate(
+            _sorted_posts(source_posts_by_lang[lang_key]), start=1
+        )
+    ]
+    for lang_key, _, post in source_jobs:
+        enrich_post(post, lang_key)
+    with ThreadPoolExecutor(max_workers=_RENDER_WORKERS) as render_pool:
+        post_futures = [
+            (
+                f"source post {lang_key}/blog/{post['slug']}.html",
+                render_pool.submit(
+                    _render_source_post_output,
                     post,
                     lang_key=lang_key,
                     posts_for_lang=source_posts_by_lang[lang_key],
                     staging_dir=staging_dir,
-                )
-            except Exception as e:
-                log_line(
-                    f"Error generating source post {lang_key}/blog/{post['slug']}.html: {e}",
-                    indent=2,
-                    status="error",
-                )
-                return False
+                    rendered_outputs=rendered_outputs,
+                    post_number=post_number,
+                    precompress=precompress,
+                ),
+            )
+            for lang_key, post_number, post in source_jobs
+        ]
+        static_futures = [
+            (
+                "en/about.html",
+                render_pool.submit(
+                    _write_source_about_output,
+                    lang_key="en",
+                    staging_dir=staging_dir,
+                    precompress=precompress,
+                ),
+            ),
+            (
+                "en/cv.html",
+                render_pool.submit(
+                    _write_source_cv_output,
+                    lang_key="en",
+                    staging_dir=staging_dir,
+                    precompress=precompress,
+                ),
+            ),
+        ]
+    for label, future in post_futures:
+        try:
+            _record_source_post_output(future.result(), rendered_outputs)
+        except Exception as e:
+            log_line(f"Error generating {label}: {e}", indent=2, status="error")
+            return False
 
     try:
-        _commit_source_about_output(lang_key="en", staging_dir=staging_dir)
-        _commit_source_cv_output(lang_key="en", staging_dir=staging_dir)
+        for output_key, future in static_futures:
+            _log_source_output(output_key, future.result())
     except Exception as e:
         log_line(f"Error generating source static pages: {e}", indent=2, status="error")
         return False
@@ -705,61 +1360,48 @@ def build(
         log_line("Skipping source indexes for focused post build", indent=2)
         log_line("Skipping source sitemap for focused post build", indent=2)
     else:
-        for lang_key in get_language_codes():
-            if rendered_posts_by_lang[lang_key]:
-                try:
-                    _commit_language_index(
+        # Language indexes and the sitemap only read the rendered post lists,
+        # so they render and write side by side instead of one after another.
+        # As with the post pages, display memos are filled and results logged
+        # on this thread.
+        index_langs = [
+            lang_key for lang_key in get_language_codes() if rendered_posts_by_lang[lang_key]
+        ]
+        for lang_key in index_langs:
+            for post in rendered_posts_by_lang[lang_key]:
+                enrich_post(post, lang_key)
+        with ThreadPoolExecutor(max_workers=_RENDER_WORKERS) as render_pool:
+            listing_futures = [
+                (
+                    f"{lang_key}/index.html",
+                    render_pool.submit(
+                        _write_language_index,
                         posts=rendered_posts_by_lang[lang_key],
                         lang_key=lang_key,
                         staging_dir=staging_dir,
-                        source_build=True,
-                    )
-                except Exception as e:
-                    log_line(
-                        f"Error generating source index {lang_key}/index.html: {e}",
-                        indent=2,
-                        status="error",
-                    )
-                    return False
-        try:
-            _commit_sitemap_output(
-                posts_en=rendered_posts_by_lang["en"],
-                posts_pt=rendered_posts_by_lang["pt"],
-                staging_dir=staging_dir,
-                source_build=True,
+                        precompress=precompress,
+                    ),
+                )
+                for lang_key in index_langs
+            ]
+            listing_futures.append(
+                (
+                    "sitemap.xml",
+                    render_pool.submit(
+                        _write_sitemap_output,
+                        posts_en=rendered_posts_by_lang["en"],
+                        posts_pt=rendered_posts_by_lang["pt"],
+                        staging_dir=staging_dir,
+                        precompress=precompress,
+                    ),
+                )
             )
-        except Exception as e:
-            log_line(f"Error generating source sitemap.xml: {e}", indent=2, status="error")
-            return False
-
-    # Initialize translation runtime after source outputs exist.
-    try:
-        post_translator = TranslationV2PostOrchestrator(
-            provider_name=provider_name,
-            strict_validation=strict,
-            cache_path=TRANSLATION_CACHE,
-            prompt_version=os.getenv("TRANSLATION_V2_PROMPT_VERSION", "v2"),
-        )
-        _log_translation_v2_debug_context(post_translator)
-        log_block(
-            "Translation system initialized",
-            [
-                ("Provider", provider_name),
-                ("Prompt version", getattr(post_translator, "prompt_version", "unknown")),
-                ("Translation model", getattr(post_translator, "_model_id", "unknown")),
-                ("Critique model", getattr(post_translator, "_critique_model_id", "unknown")),
-                ("Revision model", getattr(post_translator, "_revision_model_id", "unknown")),
-            ],
-        )
-        log_blank()
-    except Exception as e:
-        log_block(
-            "Translation system error",
-            [("Error", str(e)), ("Action", "fix translation issues and retry")],
-            status="error",
-        )
-        log_blank()
-        return False
+        for output_key, future in listing_futures:
+            try:
+                _log_listing_output(output_key, future.result(), source_build=True)
+            except Exception as e:
+                log_line(f"Error generating source {output_key}: {e}", indent=2, status="error")
+                return False
 
     # Static translation lane: About/CV after source pages already exist.
     try:
@@ -772,6 +1414,9 @@ def build(
                 raise Exception("Could not load cv_data.yaml for fallback")
             cv_pt_translated = cv_data_en
         else:
+            post_translator = _start_post_translator(provider_name, strict)
+            if post_translator is None:
+                return False
             log_block(
                 "Translating about/cv via translation_v2 pipeline",
                 [("Provider", provider_name)],
@@ -801,8 +1446,12 @@ def build(
                 force_revision_reason=cv_force_revision,
             )
 
-        _commit_translated_about_output(about_pt_translated, staging_dir=staging_dir)
-        _commit_translated_cv_output(cv_pt_translated, staging_dir=staging_dir)
+        _commit_translated_about_output(
+            about_pt_translated, staging_dir=staging_dir, precompress=precompress
+        )
+        _commit_translated_cv_output(
+            cv_pt_translated, staging_dir=staging_dir, precompress=precompress
+        )
     except Exception as e:
         log_block(
             "Translation system error",
@@ -816,6 +1465,17 @@ def build(
     log_block("Translating posts", [("Artifacts", f"{len(parsed_posts)} file(s)")])
     log_blank()
 
+    # --incremental: reuse a post's last accepted translation when neither it
+    # nor any translation state changed since (see _translation_state_salt).
+    translation_salt = _translation_state_salt(provider_name) if incremental else None
+    reused_translations = metadata_store.setdefault(TRANSLATED_POSTS_KEY, {})
+    # Listings (language index + sitemap) are re-committed after each fresh
+    # translation so every accepted post is published as it lands.  Reused
+    # translations only mark them stale; stale listings are flushed before
+    # the next provider call and once after the loop, instead of re-rendering
+    # the whole index for every unchanged post.
+    stale_listing_langs: set[str] = set()
+
     for parsed_post in parsed_posts:
         md_file = parsed_post["md_file"]
         post_source = parsed_post["post"]
@@ -824,132 +1484,174 @@ def build(
         target_lang_key = parsed_post["target_lang_key"]
 
         try:
-            translated_output_path = LANG_DIRS[target_lang_key] / "blog" / f"{post_source['slug']}.html"
-            force_revision_reason = (
-                "translated output missing"
-                if not _live_output_exists(translated_output_path)
-                else None
-            )
-            translated_post = post_translator.translate_if_needed_unpersisted(
-                post_source,
-                target_locale=target_locale,
-                force_revision_reason=force_revision_reason,
+            translated_output_path, output_key = _post_output_target(
+                target_lang_key, post_source["slug"]
             )
-            if not translated_post:
-                quality_stats["failed"] += 1
-                raise Exception(
-                    f"Translation failed for {md_file.name} "
-                    f"({source_locale} -> {target_locale})"
+            translated_post = None
+            if translation_salt is not None:
+                translation_signature = _translation_signature(
+                    post_source, target_locale, translation_salt
                 )
-            quality_stats["translated"] += 1
-            source_content = str(post_source.get("raw_content", ""))
-            translated_content = str(
-                translated_post.get("raw_content", translated_post.get("content", ""))
-            )
-            if _is_presentation_post(post_source):
-                markers_valid, marker_issues = validate_presentation_translation(
-                    source_content,
-                    translated_content,
+                if _live_output_exists(translated_output_path):
+                    translated_post = _load_reused_translation(
+                        reused_translations,
+                        output_key,
+                        translation_signature,
+                        lang_key=target_lang_key,
+                        slug=post_source["slug"],
+                    )
+                if translated_post is not None:
+                    quality_stats["reused"] += 1
+                    log_line(f"translation unchanged: {output_key}", indent=1)
+            reused = translated_post is not None
+            if translated_post is None:
+                if stale_listing_langs:
+                    _commit_translated_listings(
+                        stale_listing_langs,
+                        rendered_posts_by_lang,
+                        staging_dir,
+                        precompress=precompress,
+                    )
+                force_revision_reason = (
+                    "translated output missing"
+                    if not _live_output_exists(translated_output_path)
+                    else None
                 )
-                if not markers_valid:
+                if post_translator is None:
+                    post_translator = _start_post_translator(provider_name, strict)
+                    if post_translator is None:
+                        return False
+                translated_post = post_translator.translate_if_needed_unpersisted(
+                    post_source,
+                    target_locale=target_locale,
+                    force_revision_reason=force_revision_reason,
+                )
+                if not translated_post:
                     quality_stats["failed"] += 1
-                    for issue in marker_issues:
-                        log_line(
-                            f"[presentation] {post_source['slug']}: {issue}",
-                            indent=1,
-                            status="error",
-                        )
                     raise Exception(
-                        "Presentation marker validation failed for "
-                        f"{post_source['slug']}"
+                        f"Translation failed for {md_file.name} "
+                        f"({source_locale} -> {target_locale})"
                     )
-                translated_post = _prepare_presentation_post(translated_post)
-                is_valid, issues = True, []
-            else:
-                is_valid, issues = validate_translation(
-                    source_content,
-                    translated_content,
-                    source_locale=normalize_locale(source_locale),
-                    target_locale=normalize_locale(target_locale),
+                quality_stats["translated"] += 1
+                source_content = str(post_source.get("raw_content", ""))
+                translated_content = str(
+                    translated_post.get("raw_content", translated_post.get("content", ""))
                 )
+                if _is_presentation_post(post_source):
+                    markers_valid, marker_issues = validate_presentation_translation(
+                        source_content,
+                        translated_content,
+                    )
+                    if not markers_valid:
+                        quality_stats["failed"] += 1
+                        for issue in marker_issues:
+                            log_line(
+                                f"[presentation] {post_source['slug']}: {issue}",
+                                indent=1,
+                                status="error",
+                            )
+                        raise Exception(
+                            "Presentation marker validation failed for "
+                            f"{post_source['slug']}"
+                        )
+                    translated_post = _prepare_presentation_post(translated_post)
+                    is_valid, issues = True, []
+                else:
+                    from translation_common import validate_translation
+
+                    is_valid, issues = validate_translation(
+                        source_content,
+                        translated_content,
+                        source_locale=normalize_locale(source_locale),
+                        target_locale=normalize_locale(target_locale),
+                    )
 
-            if not issues:
-                quality_stats["validated_ok"] += 1
-            elif is_valid:
-                quality_stats["validated_warnings"] += 1
-                quality_stats["issues"].append((post_source["slug"], issues))
-                for issue in issues:
-                    log_line(f"[quality] {post_source['slug']}: {issue}", indent=1, status="info")
-            else:
-                quality_stats["issues"].append((post_source["slug"], issues))
-                for issue in issues:
-                    log_line(f"[quality] {post_source['slug']}: {issue}", indent=1, status="error")
-                if strict:
-                    quality_stats["failed"] += 1
+                if not issues:
+                    quality_stats["validated_ok"] += 1
+                elif is_valid:
+                    quality_stats["validated_warnings"] += 1
+                    quality_stats["issues"].append((post_source["slug"], issues))
+                    for issue in issues:
+                        log_line(f"[quality] {post_source['slug']}: {issue}", indent=1, status="info")
+                else:
+                    quality_stats["issues"].append((post_source["slug"], issues))
+                    for issue in issues:
+                        log_line(f"[quality] {post_source['slug']}: {issue}", indent=1, status="error")
+                    if strict:
+                        quality_stats["failed"] += 1
+                        log_line(
+                            f"STRICT: validation failed for {post_source['slug']}",
+                            indent=1,
+                            status="error",
+                        )
+                        return False
+                    quality_stats["validated_warnings"] += 1
                     log_line(
-                        f"STRICT: validation failed for {post_source['slug']}",
+                        f"(non-strict: continuing despite errors for {post_source['slug']})",
                         indent=1,
-                        status="error",
+                        status="info",
                     )
-                    return False
-                quality_stats["validated_warnings"] += 1
-                log_line(
-                    f"(non-strict: continuing despite errors for {post_source['slug']})",
-                    indent=1,
-                    status="info",
-                )
 
-            persist_context = post_translator.consume_artifact_persist_context(
-                slug=str(post_source.get("slug") or ""),
-                artifact_type=str(post_source.get("content_type") or "post"),
-            )
-            if persist_context.get("outcome") != "cache_hit":
-                persist_frontmatter = {
-                    "title": post_source.get("title", ""),
-                    "excerpt": post_source.get("excerpt", ""),
-                    "tags": post_source.get("tags", []),
-                }
-                if _is_presentation_post(post_source):
-                    persist_frontmatter["content_type"] = "presentation"
-                post_translator.persist_artifact_translation(
+                persist_context = post_translator.consume_artifact_persist_context(
                     slug=str(post_source.get("slug") or ""),
-                    source_text=str(
-                        post_source.get("raw_content", post_source.get("content", ""))
-                    ),
-                    source_locale=source_locale,
-                    target_locale=target_locale,
                     artifact_type=str(post_source.get("content_type") or "post"),
-                    frontmatter=persist_frontmatter,
-                    translation={
-                        "title": translated_post["title"],
-                        "excerpt": translated_post["excerpt"],
-                        "tags": translated_post["tags"],
-                        "content": translated_post["raw_content"],
-                    },
-                    revised_from_cache_source=persist_context.get(
-                        "revised_from_cache_source"
-                    ),
                 )
+                if persist_context.get("outcome") != "cache_hit":
+                    persist_frontmatter = {
+                        "title": post_source.get("title", ""),
+                        "excerpt": post_source.get("excerpt", ""),
+                        "tags": post_source.get("tags", []),
+                    }
+                    if _is_presentation_post(post_source):
+                        persist_frontmatter["content_type"] = "presentation"
+                    post_translator.persist_artifact_translation(
+                        slug=str(post_source.get("slug") or ""),
+                        source_text=str(
+                            post_source.get("raw_content", post_source.get("content", ""))
+                        ),
+                        source_locale=source_locale,
+                        target_locale=target_locale,
+                        artifact_type=str(post_source.get("content_type") or "post"),
+                        frontmatter=persist_frontmatter,
+                        translation={
+                            "title": translated_post["title"],
+                            "excerpt": translated_post["excerpt"],
+                            "tags": translated_post["tags"],
+                            "content": translated_post["raw_content"],
+                        },
+                        revised_from_cache_source=persist_context.get(
+                            "revised_from_cache_source"
+                        ),
+                    )
+                # Posts with quality findings are re-checked every build so
+                # their warnings keep surfacing.
+                if translation_salt is not None and not issues:
+                    _store_reused_translation(
+                        reused_translations,
+                        output_key,
+                        translation_signature,
+                        translated_post,
+                        lang_key=target_lang_key,
+                        slug=post_source["slug"],
+                    )
             rendered_posts_by_lang[target_lang_key].append(translated_post)
             _commit_translated_post_output(
                 translated_post,
                 lang_key=target_lang_key,
                 posts_for_lang=rendered_posts_by_lang[target_lang_key],
                 staging_dir=staging_dir,
+                rendered_outputs=rendered_outputs,
+                precompress=precompress,
             )
             if not focused_post_build:
-                _commit_language_index(
-                    posts=rendered_posts_by_lang[target_lang_key],
-                    lang_key=target_lang_key,
-                    staging_dir=staging_dir,
-                    source_build=False,
-                )
-                _commit_sitemap_output(
-                    posts_en=rendered_posts_by_lang["en"],
-                    posts_pt=rendered_posts_by_lang["pt"],
-                    staging_dir=staging_dir,
-                    source_build=False,
-                )
+                stale_listing_langs.add(target_lang_key)
+                if not reused:
+                    _commit_translated_listings(
+                        stale_listing_langs,
+                        rendered_posts_by_lang,
+                        staging_dir,
+                        precompress=precompress,
+                    )
             if verbose:
                 log_line(
                     f"Translated {md_file.name} ({target_locale.upper()})",
@@ -960,6 +1662,18 @@ def build(
             log_line(f"Error: {e}", indent=1, status="error")
             return False
 
+    if stale_listing_langs:
+        try:
+            _commit_translated_listings(
+                stale_listing_langs, rendered_posts_by_lang, staging_dir, precompress=precompress
+            )
+        except Exception as e:
+            log_line(f"Error: {e}", indent=1, status="error")
+            return False
+
+    # Record render fingerprints so the next build can skip unchanged pages.
+    save_post_metadata(metadata_store)
+
     posts_en = rendered_posts_by_lang["en"]
     posts_pt = rendered_posts_by_lang["pt"]
 
@@ -973,8 +1687,9 @@ def build(
         log_block("Root landing page", indent=1)
         try:
             root_html = generate_root_index()
-            root_index = _out(PROJECT_ROOT / "index.html", staging_dir)
-            root_index.write_text(root_html, encoding="utf-8")
+            _write_output_file(
+                PROJECT_ROOT / "index.html", root_html, staging_dir, precompress=precompress
+            )
             log_line("index.html", indent=2, status="success")
         except Exception as e:
             log_line(f"Error generating root index.html: {e}", indent=2, status="error")
@@ -1015,11 +1730,19 @@ def build(
                 if staged.exists():
                     staged.rename(PROJECT_ROOT / lang_dir)
 
-            # Phase 3: atomic replace for root-level files
+            # Phase 3: atomic replace for root-level files.  Precompressed
+            # copies follow their page; a live copy with no staged
+            # counterpart is left over from an earlier --precompress build.
             for name in ("index.html", "sitemap.xml"):
                 src = staging_dir / name
                 if src.exists():
                     src.replace(PROJECT_ROOT / name)
+                    for suffix in _COMPRESSED_SUFFIXES:
+                        staged_sibling = staging_dir / (name + suffix)
+                        if staged_sibling.exists():
+                            staged_sibling.replace(PROJECT_ROOT / (name + suffix))
+                        else:
+                            (PROJECT_ROOT / (name + suffix)).unlink(missing_ok=True)
 
             # Phase 4: clean up
             if old_dir.exists():
@@ -1059,7 +1782,7 @@ def build(
     # ---------------------------------------------------------------
     # Translation quality summary
     # ---------------------------------------------------------------
-    if quality_stats["translated"] > 0:
+    if quality_stats["translated"] > 0 or quality_stats["reused"] > 0:
         total = quality_stats["translated"]
         ok = quality_stats["validated_ok"]
         warn = quality_stats["validated_warnings"]
@@ -1071,6 +1794,7 @@ def build(
             f"Translation quality report ({mode} mode)",
             [
                 ("Translated", total),
+                ("Reused unchanged", quality_stats["reused"]),
                 ("Validated OK", ok),
                 ("Validated w/ warnings", warn),
                 ("Failed", fail),
@@ -1123,9 +1847,26 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Show runner-level translation details in the live dashboard",
     )
+    parser.add_argument(
+        "--clean-cache",
+        action="store_true",
+        help="Discard cached Markdown renders before building",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse cached parses and translations of posts that are unchanged",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Also write .gz (and .br, if brotli is installed) copies of every output",
+    )
 
     args = parser.parse_args(argv)
 
+    ensure_dirs()
+
     # STRICT_BUILD=1 remains as env fallback for non-CLI automation.
     strict_mode = args.strict or os.environ.get("STRICT_BUILD") == "1"
     try:
@@ -1135,6 +1876,9 @@ def main(argv: list[str] | None = None) -> int:
             post_selector=args.post,
             skip_about_cv_translation=args.skip_about_cv_translation,
             verbose=args.verbose,
+            clean_cache=args.clean_cache,
+            incremental=args.incremental,
+            precompress=args.precompress,
         )
     except KeyboardInterrupt:
         shutdown_console()
@@ -4,17 +4,221 @@ Handles loading posts from Markdown files with YAML frontmatter,
 and managing the sidecar metadata manifest at _cache/post-metadata.json.
 """
 
+import hashlib
 import json
+import mmap
+import pickle
+import shutil
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
-import frontmatter
+import markdown
+
+import yaml
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 from paths import METADATA_FILE
-from helpers import calculate_content_hash, calculate_reading_time
+from helpers import MONTH_NAMES, calculate_content_hash, calculate_reading_time, parse_post_date
+import markdown_refs
 from markdown_refs import render_markdown_with_internal_refs
 
 
+# Wall-clock timestamp shared by every post parsed in one build (see
+# start_build_clock); None outside a build, where each call reads the clock once.
+_build_started_at: Optional[datetime] = None
+
+
+def start_build_clock() -> datetime:
+    """Pin the timestamp used for new/changed manifest entries in this build.
+
+    Every post touched by one build then shares the same created_at/updated_at
+    value and parse_markdown_post no longer reads the clock per post.
+
+    Returns:
+        datetime: The pinned build start time.
+    """
+    global _build_started_at
+    _build_started_at = datetime.now()
+    return _build_started_at
+
+
+# On-disk cache of rendered post bodies (see configure_markdown_cache); None
+# disables it, which is the default outside a build.
+_markdown_cache_dir: Optional[Path] = None
+_markdown_cache_salt: Optional[str] = None
+
+
+def configure_markdown_cache(cache_dir: Optional[Path], *, clear: bool = False) -> None:
+    """Enable (or disable with None) the rendered-Markdown cache for this process.
+
+    Args:
+        cache_dir (Path | None): Directory holding ``<key>.html`` entries.
+        clear (bool): Wipe the directory first (``build.py --clean-cache``).
+    """
+    global _markdown_cache_dir
+    if cache_dir is not None and clear:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    _markdown_cache_dir = cache_dir
+
+
+def _markdown_renderer_salt() -> str:
+    global _markdown_cache_salt
+    if _markdown_cache_salt is None:
+        refs_source = Path(markdown_refs.__file__).read_bytes()
+        _markdown_cache_salt = hashlib.sha256(
+            markdown.__version__.encode("utf-8") + b"\0" + refs_source
+        ).hexdigest()
+    return _markdown_cache_salt
+
+
+def _markdown_cache_key(body: str, nl2br: bool = False) -> str:
+    """Key a post body by its text plus everything that shapes its HTML.
+
+    The salt covers the python-markdown version and the source of
+    markdown_refs (extension list, anchor/permalink treeprocessor), so any
+    renderer change invalidates every entry without a manual wipe.
+    """
+    # Build-local key, never compared outside this cache: 128-bit BLAKE2b is
+    # ample for change detection and cheaper than SHA-256 on large bodies.
+    digest = hashlib.blake2b(
+        f"{_markdown_renderer_salt()}\0{int(nl2br)}\0".encode("utf-8"), digest_size=16
+    )
+    digest.update(body.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def render_post_markdown(body: str, nl2br: bool = False) -> str:
+    """Render a post body to HTML, reusing the on-disk cache when enabled."""
+    if _markdown_cache_dir is None:
+        return render_markdown_with_internal_refs(body, source_markdown=body, nl2br=nl2br)
+
+    cache_file = _markdown_cache_dir / f"{_markdown_cache_key(body, nl2br)}.html"
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    html_content = render_markdown_with_internal_refs(body, source_markdown=body, nl2br=nl2br)
+    try:
+        _markdown_cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".html.tmp")
+        tmp.write_text(html_content, encoding="utf-8")
+        tmp.replace(cache_file)
+    except OSError:
+        pass  # a cache write failure must never fail the build
+    return html_content
+
+
+# Namespace inside the sidecar manifest recording, per source file name, the
+# signature its pickled parse (``build.py --incremental``) was made from:
+# ``[mtime_ns, size, salt, content_digest]``.
+PARSED_SOURCES_KEY = "__parsed_sources__"
+_parsed_post_salt: Optional[str] = None
+
+# Sources (next to this module) whose code shapes a parsed post: the parser
+# itself, the date/reading-time helpers and the site config they read.
+_PARSE_INPUT_MODULES = ("content_loader.py", "helpers.py", "config.py")
+
+
+def _parsed_post_signature(filepath: Path) -> list:
+    """stat() identity of a source file plus everything its parse depends on."""
+    global _parsed_post_salt
+    if _parsed_post_salt is None:
+        digest = hashlib.sha256(_markdown_renderer_salt().encode("utf-8"))
+        source_dir = Path(__file__).resolve().parent
+        for name in _PARSE_INPUT_MODULES:
+            try:
+                digest.update((source_dir / name).read_bytes())
+            except OSError:
+                continue
+        _parsed_post_salt = digest.hexdigest()
+    stat = filepath.stat()
+    return [stat.st_mtime_ns, stat.st_size, _parsed_post_salt]
+
+
+def _source_digest(text: str) -> str:
+    # Frontmatter and body together: a parse depends on both.
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_cached_post(filepath: Path, metadata_store: dict, cache_dir: Path) -> Optional[dict]:
+    """Return the cached parse of an unchanged source file, or None.
+
+    An unchanged mtime/size is trusted without reading the file.  When only
+    the mtime moved (checkout, touch, editor save without edits) the file is
+    hashed instead, and a matching digest still counts as a hit.
+
+    Args:
+        filepath (Path): Markdown source file.
+        metadata_store (dict): Live manifest dict.
+        cache_dir (Path): Directory holding ``<stem>.pkl`` entries.
+
+    Returns:
+        dict | None: The post dict parse_markdown_post() returned when the
+            file last had this content, or None on any mismatch.
+    """
+    recorded = metadata_store.get(PARSED_SOURCES_KEY, {}).get(filepath.name)
+    try:
+        current = _parsed_post_signature(filepath)
+        if not isinstance(recorded, list) or len(recorded) != 4 or recorded[1:3] != current[1:]:
+            return None
+        if recorded[0] != current[0]:
+            if recorded[3] != _source_digest(read_post_source(filepath)):
+                return None
+            recorded[0] = current[0]
+        with open(cache_dir / f"{filepath.stem}.pkl", "rb") as f:
+            post = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    return post if isinstance(post, dict) else None
+
+
+def store_cached_post(filepath: Path, post: dict, metadata_store: dict, cache_dir: Path) -> None:
+    """Pickle a freshly parsed post and record its source signature.
+
+    The content digest is the one parse_markdown_post() took of the text it
+    read (``post["_source_digest"]``), so the source is not read again.
+    Posts whose date fell back to the build date (no usable frontmatter
+    ``date``) are not cached: the pickle would freeze "today" for good.
+
+    Args:
+        filepath (Path): Markdown source file the post was parsed from.
+        post (dict): Result of parse_markdown_post().
+        metadata_store (dict): Live manifest dict (saved by the caller).
+        cache_dir (Path): Directory holding ``<stem>.pkl`` entries.
+    """
+    source_digest = post.get("_source_digest")
+    if source_digest is None or post.get("_date_defaulted"):
+        return
+    try:
+        signature = [*_parsed_post_signature(filepath), source_digest]
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = cache_dir / f"{filepath.stem}.pkl"
+        tmp = cache_file.with_suffix(".pkl.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(post, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache_file)
+    except OSError:
+        return  # a cache write failure must never fail the build
+    metadata_store.setdefault(PARSED_SOURCES_KEY, {})[filepath.name] = signature
+
+
+# Serialized form of the manifest as last read from / written to disk, so a
+# build whose posts are all unchanged does not rewrite an identical file.
+_manifest_on_disk: Optional[bytes] = None
+
+
+def _serialize_post_metadata(metadata: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    return json.dumps(metadata, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def load_post_metadata() -> dict:
     """Load the sidecar post metadata manifest from _cache/post-metadata.json.
 
@@ -27,10 +231,16 @@ def load_post_metadata() -> dict:
         dict: Mapping of slug -> {content_hash, created_at, updated_at}.
               Returns empty dict if the file does not exist yet.
     """
+    global _manifest_on_disk
+    _manifest_on_disk = None
     if METADATA_FILE.exists():
         try:
-            return json.loads(METADATA_FILE.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            raw = METADATA_FILE.read_bytes()
+            metadata = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            _manifest_on_disk = raw
+            return metadata
+        except (ValueError, OSError):
+            # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
             return {}
     return {}
 
@@ -39,14 +249,93 @@ def save_post_metadata(metadata: dict) -> None:
     """Persist the sidecar post metadata manifest to _cache/post-metadata.json.
 
     Writes atomically (temp file + rename) so a failed build never corrupts
-    the manifest.
+    the manifest. Uses orjson when it is installed; output is the same
+    2-space-indented UTF-8 JSON either way. Skips the write entirely when the
+    serialized manifest matches what was last loaded or saved.
 
     Args:
         metadata (dict): Full manifest dict to persist.
     """
+    global _manifest_on_disk
+    payload = _serialize_post_metadata(metadata)
+    if payload == _manifest_on_disk and METADATA_FILE.exists():
+        return
+    METADATA_FILE.parent.mkdir(parents=True, exist_ok=True)
     tmp = METADATA_FILE.with_suffix(".json.tmp")
-    tmp.write_text(json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp.write_bytes(payload)
     tmp.replace(METADATA_FILE)
+    _manifest_on_disk = payload
+
+
+def read_post_source(filepath) -> str:
+    """Read a Markdown source file as text via a read-only memory map.
+
+    The file is decoded straight from the mapped pages, skipping the
+    intermediate buffer copy a regular ``read()`` makes.  Newlines are
+    normalized the same way text-mode ``open()`` would.
+
+    Args:
+        filepath (Path): Path to the Markdown file.
+
+    Returns:
+        str: Decoded file contents ('' for an empty file).
+    """
+    with open(filepath, "rb") as f:
+        # mmap cannot map a zero-length file
+        if not f.seek(0, 2):
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                text = str(view, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _is_frontmatter_boundary(line: str) -> bool:
+    stripped = line.rstrip()
+    return len(stripped) >= 3 and stripped == "-" * len(stripped)
+
+
+def split_frontmatter(text: str) -> tuple[dict, str]:
+    """Split a post into its YAML frontmatter and Markdown body in one scan.
+
+    Boundaries are located with ``str.find`` instead of a regex split over
+    the whole document, and the body is returned as a slice of the source
+    text.  Mirrors python-frontmatter's YAML handling: a document without a
+    closing ``---`` line is treated as all body, and both parts are stripped.
+
+    Args:
+        text (str): Full Markdown source, as returned by read_post_source().
+
+    Returns:
+        tuple[dict, str]: (frontmatter metadata, Markdown body).
+    """
+    text = text.strip()
+    first_eol = text.find("\n")
+    if first_eol == -1 or not _is_frontmatter_boundary(text[:first_eol]):
+        return {}, text
+
+    search_from = first_eol
+    while True:
+        boundary = text.find("\n---", search_from)
+        if boundary == -1:
+            return {}, text
+        line_end = text.find("\n", boundary + 1)
+        if line_end == -1:
+            line_end = len(text)
+        if _is_frontmatter_boundary(text[boundary + 1 : line_end]):
+            break
+        search_from = line_end
+
+    metadata = yaml.load(text[first_eol + 1 : boundary], Loader=_YAML_LOADER)
+    if not isinstance(metadata, dict):
+        metadata = {}
+    return metadata, text[line_end:].strip()
 
 
 def parse_markdown_post(filepath, _metadata_store: Optional[dict] = None):
@@ -72,33 +361,37 @@ def parse_markdown_post(filepath, _metadata_store: Optional[dict] = None):
         Dict: Post data with title, excerpt, tags, language metadata, dates,
               content, etc. Returns None if file doesn't exist or fails to parse.
     """
-    post = frontmatter.load(filepath)
+    source_text = read_post_source(filepath)
+    meta, body = split_frontmatter(source_text)
 
     # Get filename without extension
     filename = filepath.stem
-    slug = post.get("slug", filename)
+    slug = meta.get("slug", filename)
 
     # Calculate content hash for change detection
-    content_hash = calculate_content_hash(post.content)
+    content_hash = calculate_content_hash(body)
+
+    build_now = _build_started_at or datetime.now()
+    now = build_now.isoformat()
 
     # --- Sidecar manifest handling (no .md mutation) ---
     own_store = _metadata_store is None
     if own_store:
         _metadata_store = load_post_metadata()
 
-    entry = _metadata_store.get(slug, {})
+    # Copied, never mutated in place: build() parses on worker threads against
+    # a private view of the manifest and merges replaced entries itself.
+    entry = dict(_metadata_store.get(slug, {}))
 
     # Migrate legacy frontmatter fields into the manifest on first encounter
     if not entry:
         entry = {
-            "content_hash": post.get("content_hash", content_hash),
-            "created_at": post.get("created_at") or datetime.now().isoformat(),
-            "updated_at": post.get("updated_at") or datetime.now().isoformat(),
+            "content_hash": meta.get("content_hash", content_hash),
+            "created_at": meta.get("created_at") or now,
+            "updated_at": meta.get("updated_at") or now,
         }
         _metadata_store[slug] = entry
 
-    now = datetime.now().isoformat()
-
     if entry.get("content_hash") != content_hash:
         # Content changed (or first time hash is tracked) -- record new hash/timestamp
         entry["content_hash"] = content_hash
@@ -115,59 +408,57 @@ def parse_markdown_post(filepath, _metadata_store: Optional[dict] = None):
         save_post_metadata(_metadata_store)
 
     # --- Editorial date validation ---
+    # Warnings are returned with the post (not printed) so build() can log
+    # them in file order from its parse threads.
+    warnings = []
     # Warn if frontmatter 'date' (publication date) is missing
-    if not post.get("date"):
-        print(
-            f"   Warning: '{slug}' is missing frontmatter 'date' (publication date); defaulting to today"
+    if not meta.get("date"):
+        warnings.append(
+            f"'{slug}' is missing frontmatter 'date' (publication date); defaulting to today"
         )
 
     # Warn if frontmatter 'updated' is before 'date' (likely a typo)
-    fm_date_str = str(post.get("date", ""))
-    fm_updated_str = str(post.get("updated", ""))
+    fm_date_str = str(meta.get("date", ""))
+    fm_updated_str = str(meta.get("updated", ""))
     if fm_date_str and fm_updated_str:
-        try:
-            fm_date_parsed = datetime.strptime(fm_date_str, "%Y-%m-%d")
-            fm_updated_parsed = datetime.strptime(fm_updated_str, "%Y-%m-%d")
-            if fm_updated_parsed < fm_date_parsed:
-                print(
-                    f"   Warning: '{slug}' has 'updated' ({fm_updated_str}) before 'date' ({fm_date_str})"
-                )
-        except (ValueError, TypeError):
-            pass
-
-    # Convert markdown content to HTML
-    html_content = render_markdown_with_internal_refs(post.content, source_markdown=post.content)
+        fm_date_parsed = parse_post_date(fm_date_str)
+        fm_updated_parsed = parse_post_date(fm_updated_str)
+        if fm_date_parsed and fm_updated_parsed and fm_updated_parsed < fm_date_parsed:
+            warnings.append(
+                f"'{slug}' has 'updated' ({fm_updated_str}) before 'date' ({fm_date_str})"
+            )
+
+    # Convert markdown content to HTML; single-newline hard breaks are opt-in
+    nl2br = bool(meta.get("nl2br", False))
+    html_content = render_post_markdown(body, nl2br)
 
     # Keep raw markdown for translation
-    raw_markdown = post.content
+    raw_markdown = body
 
     # Parse date and extract year/month
-    date_str = post.get("date", datetime.now().strftime("%Y-%m-%d"))
-    try:
-        post_date = datetime.strptime(str(date_str), "%Y-%m-%d")
-        year = post_date.year
-        month = post_date.strftime("%B")  # Full month name
-    except (ValueError, TypeError):
-        year = datetime.now().year
-        month = datetime.now().strftime("%B")
+    date_str = meta.get("date") if "date" in meta else build_now.strftime("%Y-%m-%d")
+    parsed_date = parse_post_date(date_str)
+    post_date = parsed_date or build_now
+    year = post_date.year
+    month = MONTH_NAMES[post_date.month - 1]
 
     # Get tags (default to empty list if not provided)
-    tags = post.get("tags", [])
+    tags = meta.get("tags", [])
     if isinstance(tags, str):
         tags = [t.strip() for t in tags.split(",")]
 
     # Get source language
-    lang = post.get("lang") or post.get("source_language") or "en-us"
+    lang = meta.get("lang") or meta.get("source_language") or "en-us"
 
     return {
-        "title": post.get("title", "Untitled Post"),
+        "title": meta.get("title", "Untitled Post"),
         "date": date_str,
         "year": year,
         "month": month,
-        "excerpt": post.get("excerpt", ""),
+        "excerpt": meta.get("excerpt", ""),
         "slug": slug,
-        "content_type": str(post.get("content_type", "post") or "post").strip().lower(),
-        "order": post.get("order", 0),
+        "content_type": str(meta.get("content_type", "post") or "post").strip().lower(),
+        "order": meta.get("order", 0),
         "tags": tags,
         "lang": lang,
         # en_tags holds the canonical English tags for stable cross-language
@@ -177,9 +468,10 @@ def parse_markdown_post(filepath, _metadata_store: Optional[dict] = None):
         # survives the dict copy unchanged, so PT cards can still emit the EN
         # canonical slugs via data-tag-keys.
         "en_tags": tags,
-        "reading_time": post.get("readingTime") or calculate_reading_time(post.content),
+        "reading_time": meta.get("readingTime") or calculate_reading_time(body),
         "content": html_content,
         "raw_content": raw_markdown,  # Keep raw markdown for translation
+        "nl2br": nl2br,  # translations render with the same line-break rule
         "created_date": created_at,  # build-internal: sidecar first-seen timestamp (NOT for display)
         "updated_date": updated_at,  # build-internal: sidecar last-change timestamp (NOT for display)
         "content_hash": content_hash,
@@ -188,6 +480,12 @@ def parse_markdown_post(filepath, _metadata_store: Optional[dict] = None):
             date_str
         ),  # frontmatter 'date' -> shown to readers, sorting, JSON-LD datePublished
         "updated_fm_date": str(
-            post.get("updated") or ""
+            meta.get("updated") or ""
         ),  # frontmatter 'updated' -> last-updated display, sitemap lastmod, JSON-LD dateModified
+        # build-internal: date/year/month came from the build clock, not frontmatter
+        "_date_defaulted": "date" not in meta or parsed_date is None,
+        # build-internal: digest of the source text read above (parsed-post cache)
+        "_source_digest": _source_digest(source_text),
+        # build-internal: editorial warnings for the caller to log
+        "_warnings": warnings,
     }
@@ -4,10 +4,17 @@ Loads structured CV data from cv_data.yaml and validates it against
 the expected schema before the build uses it.
 """
 
+import copy
+
 import yaml
 
 from paths import CV_DATA_FILE
 
+# Validated CV data keyed by (path, mtime_ns, size) of the file it came from.
+# One build loads the CV up to three times (schema check, EN page, PT
+# translation); only the first load reads, parses and validates the YAML.
+_cv_data_cache: dict[tuple[str, int, int], dict] = {}
+
 
 def load_cv_data():
     """Load and validate structured CV data from cv_data.yaml.
@@ -29,9 +36,16 @@ def load_cv_data():
     Raises:
         SystemExit: If required fields are missing or empty.
     """
-    if not CV_DATA_FILE.exists():
+    try:
+        stat = CV_DATA_FILE.stat()
+    except FileNotFoundError:
         print(f"Warning: CV data file not found at {CV_DATA_FILE}")
         return None
+    cache_key = (str(CV_DATA_FILE), stat.st_mtime_ns, stat.st_size)
+    cached = _cv_data_cache.get(cache_key)
+    if cached is not None:
+        # Callers translate and annotate the dict; each gets its own copy.
+        return copy.deepcopy(cached)
 
     with open(CV_DATA_FILE, 'r', encoding='utf-8') as f:
         try:
@@ -98,4 +112,6 @@ def load_cv_data():
     if not cv_data.get('languages_spoken'):
         print("Warning: CV languages_spoken is empty")
 
-    return cv_data
+    _cv_data_cache.clear()
+    _cv_data_cache[cache_key] = cv_data
+    return copy.deepcopy(cv_data)
@@ -10,6 +10,7 @@ Supports:
 from __future__ import annotations
 
 import re
+import threading
 import unicodedata
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
@@ -30,6 +31,8 @@ _INLINE_LINK_RE = re.compile(r"!?\[([^\]]+)\]\([^)]+\)")
 _INLINE_REFERENCE_RE = re.compile(r"\[([^\]]+)\]\[[^\]]+\]")
 _INLINE_HTML_RE = re.compile(r"<[^>]+>")
 _INLINE_MARKER_RE = re.compile(r"[*_~`]")
+_NON_SLUG_CHARS_RE = re.compile(r"[^a-z0-9]+")
+_BLOCK_OPEN_TAG_RE = re.compile(r"^<([a-z0-9]+)([^>]*)>")
 _HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
 _BLOCK_TAGS = {"p", "li", "blockquote", "pre", "table"}
 _SCROLL_TARGET_TAGS = _HEADING_TAGS | _BLOCK_TAGS
@@ -98,7 +101,7 @@ def _slugify_anchor(text: str) -> str:
     normalized = unicodedata.normalize("NFKD", _plain_text_for_slug(text))
     ascii_text = normalized.encode("ascii", "ignore").decode("ascii").lower()
     ascii_text = ascii_text.replace("'", "")
-    slug = re.sub(r"[^a-z0-9]+", "-", ascii_text).strip("-")
+    slug = _NON_SLUG_CHARS_RE.sub("-", ascii_text).strip("-")
     return slug or "section"
 
 
@@ -119,8 +122,7 @@ def _normalize_wrapped_block_html(html: str) -> str:
         block_html = match.group("block")
         if not attrs:
             return block_html
-        return re.sub(
-            r"^<([a-z0-9]+)([^>]*)>",
+        return _BLOCK_OPEN_TAG_RE.sub(
             lambda block_match: f"<{block_match.group(1)}{block_match.group(2)} {attrs}>",
             block_html,
             count=1,
@@ -273,15 +275,46 @@ class _PostAnchorExtension(Extension):
 
     def __init__(self, *, heading_specs: list[HeadingAnchorSpec]) -> None:
         self._heading_specs = heading_specs
+        self._treeprocessor: _PostAnchorTreeprocessor | None = None
         super().__init__()
 
     def extendMarkdown(self, md: markdown.Markdown) -> None:  # noqa: N802
+        self._treeprocessor = _PostAnchorTreeprocessor(md, self._heading_specs)
         md.treeprocessors.register(
-            _PostAnchorTreeprocessor(md, self._heading_specs),
+            self._treeprocessor,
             "post-anchor-treeprocessor",
             priority=15,
         )
 
+    def set_heading_specs(self, heading_specs: list[HeadingAnchorSpec]) -> None:
+        """Point the registered treeprocessor at the next document's headings."""
+        self._heading_specs = heading_specs
+        if self._treeprocessor is not None:
+            self._treeprocessor._heading_specs = heading_specs
+
+
+# Configured Markdown instances per thread, reused across documents via
+# reset() so the extension pipeline and its regexes are built only once.
+# Keyed by whether nl2br is enabled: only posts that opt in with
+# ``nl2br: true`` pay for the hard-break pass.
+_renderer_local = threading.local()
+
+
+def _get_renderer(nl2br: bool = False) -> tuple[markdown.Markdown, _PostAnchorExtension]:
+    renderers = getattr(_renderer_local, "renderers", None)
+    if renderers is None:
+        renderers = _renderer_local.renderers = {}
+    cached = renderers.get(nl2br)
+    if cached is None:
+        anchor_extension = _PostAnchorExtension(heading_specs=[])
+        extensions: list[str | Extension] = ["fenced_code", "tables"]
+        if nl2br:
+            extensions.append("nl2br")
+        extensions += ["attr_list", anchor_extension]
+        cached = (markdown.Markdown(extensions=extensions), anchor_extension)
+        renderers[nl2br] = cached
+    return cached
+
 
 def preprocess_numeric_internal_references(markdown_text: str) -> str:
     """Rewrite numeric internal citations and add reference anchors.
@@ -337,18 +370,16 @@ def render_markdown_with_internal_refs(
     markdown_text: str,
     *,
     source_markdown: str | None = None,
+    nl2br: bool = False,
 ) -> str:
-    """Render Markdown with support for post-local anchors and numeric references."""
+    """Render Markdown with support for post-local anchors and numeric references.
+
+    ``nl2br`` turns single newlines inside paragraphs into ``<br />`` for
+    posts whose frontmatter sets ``nl2br: true``.
+    """
     processed = preprocess_numeric_internal_references(markdown_text)
     anchor_source = source_markdown if source_markdown is not None else markdown_text
     heading_specs = extract_heading_anchor_specs(anchor_source)
-    renderer = markdown.Markdown(
-        extensions=[
-            "fenced_code",
-            "tables",
-            "nl2br",
-            "attr_list",
-            _PostAnchorExtension(heading_specs=heading_specs),
-        ]
-    )
-    return _normalize_wrapped_block_html(renderer.convert(processed))
+    renderer, anchor_extension = _get_renderer(nl2br)
+    anchor_extension.set_heading_specs(heading_specs)
+    return _normalize_wrapped_block_html(renderer.reset().convert(processed))
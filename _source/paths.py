@@ -28,11 +28,24 @@ STAGING_DIR = PROJECT_ROOT / '_staging'
 # Cache files
 METADATA_FILE = CACHE_DIR / "post-metadata.json"
 TRANSLATION_CACHE = CACHE_DIR / "translation-cache.json"
-
-# Ensure directories exist at import time
-POSTS_DIR.mkdir(parents=True, exist_ok=True)
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
-for _lang_dir in LANG_DIRS.values():
-    _lang_dir.mkdir(parents=True, exist_ok=True)
-    (_lang_dir / 'blog').mkdir(parents=True, exist_ok=True)
+MARKDOWN_CACHE_DIR = CACHE_DIR / "markdown-html"  # rendered post bodies keyed by content hash
+PARSED_POSTS_DIR = CACHE_DIR / "parsed-posts"  # pickled parse results for --incremental
+TRANSLATED_POSTS_DIR = CACHE_DIR / "translated-posts"  # pickled translations for --incremental
+
+_dirs_ready = False
+
+
+def ensure_dirs() -> None:
+    """Create the source, cache and per-language output directories.
+
+    Called once from the build CLI rather than at import time, so importing
+    paths (tests, tooling, a dev server reloading build) costs no syscalls.
+    Repeated calls within a process are no-ops.
+    """
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    for directory in (POSTS_DIR, CACHE_DIR, *(d / 'blog' for d in LANG_DIRS.values())):
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
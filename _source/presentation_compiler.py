@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass
 import re
+import threading
 from typing import Any
 
 import markdown
@@ -38,6 +39,9 @@ _STRUCTURAL_COMMENT_RE = re.compile(
     r"<!--\s*(?P<closing>/)?presentation:(?P<kind>block|card|column)"
     r"(?:\s+type=\"(?P<type>[A-Za-z_][\w.-]*)\")?\s*-->"
 )
+_BARE_TABLE_RE = re.compile(
+    r"(?s)(?<!<div class=\"presentation-table-wrap\" data-overflow=\"scroll\">)(<table>.*?</table>)"
+)
 
 
 class PresentationCompileError(ValueError):
@@ -69,7 +73,7 @@ class PresentationDocument:
 
     @property
     def ids(self) -> tuple[str, ...]:
-        return tuple(slide.id for slide in self.slides)
+        return tuple([slide.id for slide in self.slides])
 
 
 def compile_presentation_markdown(
@@ -161,17 +165,30 @@ def compile_presentation_markdown(
     return PresentationDocument(slides=tuple(slides))
 
 
+# One configured Markdown instance per thread, reset() between slides so the
+# extension pipeline is built once rather than once per slide.
+_slide_renderer_local = threading.local()
+
+
+def _get_slide_renderer() -> markdown.Markdown:
+    renderer = getattr(_slide_renderer_local, "renderer", None)
+    if renderer is None:
+        renderer = markdown.Markdown(
+            extensions=[
+                "fenced_code",
+                "tables",
+                "nl2br",
+                "attr_list",
+            ]
+        )
+        _slide_renderer_local.renderer = renderer
+    return renderer
+
+
 def render_slide_markdown(markdown_text: str) -> str:
     """Render slide Markdown without post anchor permalink controls."""
 
-    renderer = markdown.Markdown(
-        extensions=[
-            "fenced_code",
-            "tables",
-            "nl2br",
-            "attr_list",
-        ]
-    )
+    renderer = _get_slide_renderer().reset()
     return _wrap_markdown_tables(_promote_structural_comments(renderer.convert(markdown_text)))
 
 
@@ -209,8 +226,7 @@ def _promote_structural_comments(html: str) -> str:
 def _wrap_markdown_tables(html: str) -> str:
     """Give Markdown tables the same responsive presentation wrapper as structured tables."""
 
-    return re.sub(
-        r"(?s)(?<!<div class=\"presentation-table-wrap\" data-overflow=\"scroll\">)(<table>.*?</table>)",
+    return _BARE_TABLE_RE.sub(
         r'<div class="presentation-table-wrap" data-overflow="scroll">\1</div>',
         html,
     )
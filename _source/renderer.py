@@ -6,6 +6,8 @@ and root landing pages. Each function returns a full HTML string.
 
 import html as _html
 import re as _re
+from dataclasses import dataclass
+from functools import lru_cache
 
 from config import (
     BASE_PATH,
@@ -22,7 +24,9 @@ from config import (
 )
 from helpers import (
     _asset_hash,
+    _asset_hash_cache,
     CURRENT_YEAR,
+    MONTH_NAMES,
     tag_to_slug,
     format_date,
     format_reading_time,
@@ -32,19 +36,19 @@ from helpers import (
 from seo import render_person_jsonld, render_jsonld_script
 from cv_parser import load_cv_data
 
+# {{STRIKETHROUGH:...}} markers in the about copy, rendered as <s>.
+_STRIKETHROUGH_RE = _re.compile(r"\{\{STRIKETHROUGH:(.+?)\}\}")
+
 
 # ============================================================
 # Shared HTML Template Helpers
 # ============================================================
 
 
-def render_theme_toggle_svg():
-    """Render the sun/moon SVG icons used by all theme toggle buttons.
-
-    Returns:
-        str: SVG HTML for sun and moon icons.
-    """
-    return """<svg class="sun-icon" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+# Static icon markup shared by every page, kept as module constants so the
+# nav/lang-toggle templates splice an existing string instead of carrying
+# their own copy of the SVG source.
+_THEME_TOGGLE_SVG = """<svg class="sun-icon" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
                         <circle cx="12" cy="12" r="5"/>
                         <line x1="12" y1="1" x2="12" y2="3"/>
                         <line x1="12" y1="21" x2="12" y2="23"/>
@@ -59,6 +63,20 @@ def render_theme_toggle_svg():
                         <path d="M21 12.79A9 9 0 1 1 11.21 3 7 7 0 0 0 21 12.79z"/>
                     </svg>"""
 
+_LANG_ICON_SVG = """<svg class="lang-icon" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+            <circle cx="12" cy="12" r="10"/>
+            <path d="M2 12h20M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/>
+        </svg>"""
+
+
+def render_theme_toggle_svg():
+    """Render the sun/moon SVG icons used by all theme toggle buttons.
+
+    Returns:
+        str: SVG HTML for sun and moon icons.
+    """
+    return _THEME_TOGGLE_SVG
+
 
 def render_skip_link(lang="en"):
     """Render skip-to-content accessibility link.
@@ -73,6 +91,11 @@ def render_skip_link(lang="en"):
     return f'<a href="#main-content" class="skip-link">{label}</a>'
 
 
+# Nav markup on either side of the per-page language toggle, keyed by
+# (lang, active_page): everything but the toggle link is fixed per build.
+_nav_frame_cache: dict[tuple[str, str], tuple[str, str]] = {}
+
+
 def render_nav(lang, active_page, lang_toggle_html):
     """Render the site navigation bar shared across all pages.
 
@@ -84,13 +107,16 @@ def render_nav(lang, active_page, lang_toggle_html):
     Returns:
         str: Complete <nav> HTML element.
     """
-    ui = LANGUAGES[lang]["ui"]
+    frame = _nav_frame_cache.get((lang, active_page))
+    if frame is None:
+        ui = LANGUAGES[lang]["ui"]
 
-    blog_class = ' class="active"' if active_page == "blog" else ""
-    about_class = ' class="active"' if active_page == "about" else ""
-    cv_class = ' class="active"' if active_page == "cv" else ""
+        blog_class = ' class="active"' if active_page == "blog" else ""
+        about_class = ' class="active"' if active_page == "about" else ""
+        cv_class = ' class="active"' if active_page == "cv" else ""
 
-    return f"""<nav class="nav" style="view-transition-name: site-nav;">
+        frame = (
+            f"""<nav class="nav" style="view-transition-name: site-nav;">
         <div class="nav-container">
             <a href="{get_lang_path(lang, "index.html")}" class="logo" style="view-transition-name: landing-title;">dan.rio</a>
             <div class="nav-right">
@@ -99,13 +125,51 @@ def render_nav(lang, active_page, lang_toggle_html):
                     <li><a href="{get_lang_path(lang, "about.html")}"{about_class} style="view-transition-name: nav-about;">{ui["about"]}</a></li>
                     <li><a href="{get_lang_path(lang, "cv.html")}"{cv_class} style="view-transition-name: nav-cv;">{ui["cv"]}</a></li>
                 </ul>
-                <div style="view-transition-name: lang-toggle;">{lang_toggle_html}</div>
+                <div style="view-transition-name: lang-toggle;">""",
+            f"""</div>
                 <button id="theme-toggle" class="theme-toggle" aria-label="{_html.escape(ui["toggle_theme"])}" style="view-transition-name: theme-toggle;">
-                    {render_theme_toggle_svg()}
+                    {_THEME_TOGGLE_SVG}
                 </button>
             </div>
         </div>
-    </nav>"""
+    </nav>""",
+        )
+        _nav_frame_cache[(lang, active_page)] = frame
+    return "".join((frame[0], lang_toggle_html, frame[1]))
+
+
+# Social icon paths live in one external sprite the browser caches once,
+# instead of ~1.5KB of inline <path> data repeated in every page's footer.
+_SOCIAL_ICONS = f"{BASE_PATH}/static/images/social-icons.svg"
+
+# The footer is identical on every page except for the localized copyright
+# line, so the social links/SVG markup is assembled once at import; the
+# versioned sprite URL and the two lang-dependent fields are filled in by
+# render_footer(), once per language and build.
+_FOOTER_TEMPLATE = """<footer class="footer" style="view-transition-name: site-footer;">
+        <div class="footer-container">
+            <div class="social-links">
+                <a href="{twitter}" target="_blank" rel="noopener" aria-label="Twitter">
+                    <svg width="24" height="24" fill="currentColor" aria-hidden="true"><use href="{{icons}}#twitter"/></svg>
+                </a>
+                <a href="{github}" target="_blank" rel="noopener" aria-label="GitHub">
+                    <svg width="24" height="24" fill="currentColor" aria-hidden="true"><use href="{{icons}}#github"/></svg>
+                </a>
+                <a href="{linkedin}" target="_blank" rel="noopener" aria-label="LinkedIn">
+                    <svg width="24" height="24" fill="currentColor" aria-hidden="true"><use href="{{icons}}#linkedin"/></svg>
+                </a>
+            </div>
+            <p class="copyright">&copy; {{year}} {{all_rights_reserved}}.</p>
+        </div>
+    </footer>""".format(
+    twitter=SOCIAL_LINKS["twitter"],
+    github=SOCIAL_LINKS["github"],
+    linkedin=SOCIAL_LINKS["linkedin"],
+)
+
+
+# The footer only varies by language (CURRENT_YEAR is fixed per process).
+_footer_cache: dict[str, str] = {}
 
 
 def render_footer(lang="en"):
@@ -120,32 +184,141 @@ def render_footer(lang="en"):
     Returns:
         str: Complete <footer> HTML element.
     """
-    ui = LANGUAGES[lang]["ui"]
-    return f"""<footer class="footer" style="view-transition-name: site-footer;">
-        <div class="footer-container">
-            <div class="social-links">
-                <a href="{SOCIAL_LINKS["twitter"]}" target="_blank" rel="noopener" aria-label="Twitter">
-                    <svg width="24" height="24" viewBox="0 0 24 24" fill="currentColor">
-                        <path d="M18.244 2.25h3.308l-7.227 8.26 8.502 11.24H16.17l-5.214-6.817L4.99 21.75H1.68l7.73-8.835L1.254 2.25H8.08l4.713 6.231zm-1.161 17.52h1.833L7.084 4.126H5.117z"/>
-                    </svg>
-                </a>
-                <a href="{SOCIAL_LINKS["github"]}" target="_blank" rel="noopener" aria-label="GitHub">
-                    <svg width="24" height="24" viewBox="0 0 24 24" fill="currentColor">
-                        <path d="M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.23.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6.086 8.199-11.386 0-6.627-5.373-12-12-12z"/>
-                    </svg>
-                </a>
-                <a href="{SOCIAL_LINKS["linkedin"]}" target="_blank" rel="noopener" aria-label="LinkedIn">
-                    <svg width="24" height="24" viewBox="0 0 24 24" fill="currentColor">
-                        <path d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z"/>
-                    </svg>
-                </a>
+    footer = _footer_cache.get(lang)
+    if footer is None:
+        footer = _FOOTER_TEMPLATE.format_map(
+            {
+                "icons": f"{_SOCIAL_ICONS}?v={_asset_hash(_SOCIAL_ICONS)}",
+                "year": CURRENT_YEAR,
+                "all_rights_reserved": LANGUAGES[lang]["ui"]["all_rights_reserved"],
+            }
+        )
+        _footer_cache[lang] = footer
+    return footer
+
+
+# Opening <body> of a post page up to the nav: the copy-link labels and the
+# skip link depend only on the language, so one string serves every post
+# of that language (EN sources and PT translations alike).
+_post_body_open_cache: dict[str, str] = {}
+
+
+def _post_body_open(lang):
+    body_open = _post_body_open_cache.get(lang)
+    if body_open is None:
+        ui = LANGUAGES[lang]["ui"]
+        body_open = f"""
+<body
+    data-copy-section-link="{_html.escape(ui['copy_section_link'])}"
+    data-copy-passage-link="{_html.escape(ui['copy_passage_link'])}"
+    data-link-copied="{_html.escape(ui['link_copied'])}"
+>
+    {render_skip_link(lang)}
+    """
+        _post_body_open_cache[lang] = body_open
+    return body_open
+
+
+# Closing markup shared by every post page of a language (after the body
+# HTML): constant for the whole build, so it is formatted once per lang.
+_post_page_tail_cache: dict[str, str] = {}
+
+
+def _post_page_tail(lang):
+    tail = _post_page_tail_cache.get(lang)
+    if tail is None:
+        tail = f"""
             </div>
-            <p class="copyright">&copy; {CURRENT_YEAR} {ui["all_rights_reserved"]}.</p>
+        </article>
+    </main>
+
+    {render_footer(lang)}
+</body>
+</html>"""
+        _post_page_tail_cache[lang] = tail
+    return tail
+
+
+# Closing markup of the blog index after the post grid, likewise per lang.
+_index_page_tail_cache: dict[str, str] = {}
+
+
+def _index_page_tail(lang):
+    tail = _index_page_tail_cache.get(lang)
+    if tail is None:
+        tail = f"""
         </div>
-    </footer>"""
+    </main>
 
+    {render_footer(lang)}
+</body>
+</html>"""
+        _index_page_tail_cache[lang] = tail
+    return tail
 
-def render_head(
+
+# Versioned <link>/<script> blocks keyed by the asset lists that produced
+# them: a handful of combinations cover every page, so each is built once.
+_asset_tags_cache: dict[tuple, str] = {}
+
+
+def _render_asset_tags(stylesheets, scripts_head, scripts_defer):
+    key = (stylesheets, scripts_head, scripts_defer)
+    tags = _asset_tags_cache.get(key)
+    if tags is not None:
+        return tags
+
+    # Build versioned stylesheet links (content-hash per file)
+    css_links = "\n    ".join(
+        f'<link rel="stylesheet" href="{css}?v={_asset_hash(css)}">' for css in stylesheets
+    )
+
+    # Build script tags (head scripts get preloaded + loaded, defer scripts get deferred)
+    head_script_tags = "\n    ".join(
+        f'<link rel="preload" href="{js}?v={_asset_hash(js)}" as="script">\n    <script src="{js}?v={_asset_hash(js)}"></script>'
+        for js in scripts_head
+    )
+
+    defer_script_tags = "\n    ".join(
+        f'<script src="{js}?v={_asset_hash(js)}" defer></script>' for js in scripts_defer
+    )
+
+    tags = f"{css_links}\n    {head_script_tags}\n    {defer_script_tags}"
+    _asset_tags_cache[key] = tags
+    return tags
+
+
+def clear_render_caches():
+    """Forget the memoized page fragments and asset hashes.
+
+    build() calls this at the start of every build, so a long-lived process
+    (a dev server re-running the build) picks up edited config and assets
+    instead of serving markup cached by the previous build.
+    """
+    for cache in (
+        _nav_frame_cache,
+        _footer_cache,
+        _post_body_open_cache,
+        _post_page_tail_cache,
+        _index_page_tail_cache,
+        _asset_tags_cache,
+        _presentation_page_tail_cache,
+        _asset_hash_cache,
+    ):
+        cache.clear()
+    generate_lang_toggle_html.cache_clear()
+
+
+# Site-wide <head> block between the page-specific meta and the hreflang links.
+_HEAD_SEO_META = f"""
+    
+    <!-- Additional SEO -->
+    <meta name="author" content="{_html.escape(AUTHOR)}">
+    <meta name="robots" content="index, follow">
+    """
+
+
+def _head_parts(
     title,
     description,
     lang,
@@ -157,7 +330,7 @@ def render_head(
     scripts_head=None,
     scripts_defer=None,
 ):
-    """Render the <head> section shared across all pages.
+    """Render the <head> section shared across all pages, as string pieces.
 
     Args:
         title (str): Page title for <title> tag.
@@ -172,7 +345,9 @@ def render_head(
         scripts_defer (list, optional): JS files to load deferred.
 
     Returns:
-        str: Complete <head> HTML element.
+        list[str]: Pieces of the <head> element, in order.  Page generators
+            splice them straight into their own parts list so the
+            (large) extra_meta block is copied once, into the final page.
     """
     if stylesheets is None:
         stylesheets = [f"{BASE_PATH}/static/css/styles.css"]
@@ -190,20 +365,7 @@ def render_head(
             f"{BASE_PATH}/static/js/presentation.js",
         ]
 
-    # Build versioned stylesheet links (content-hash per file)
-    css_links = "\n    ".join(
-        f'<link rel="stylesheet" href="{css}?v={_asset_hash(css)}">' for css in stylesheets
-    )
-
-    # Build script tags (head scripts get preloaded + loaded, defer scripts get deferred)
-    head_script_tags = "\n    ".join(
-        f'<link rel="preload" href="{js}?v={_asset_hash(js)}" as="script">\n    <script src="{js}?v={_asset_hash(js)}"></script>'
-        for js in scripts_head
-    )
-
-    defer_script_tags = "\n    ".join(
-        f'<script src="{js}?v={_asset_hash(js)}" defer></script>' for js in scripts_defer
-    )
+    asset_tags = _render_asset_tags(tuple(stylesheets), tuple(scripts_head), tuple(scripts_defer))
 
     # Language alternate links (includes x-default for language-neutral fallback)
     lang_alternates = ""
@@ -213,7 +375,8 @@ def render_head(
     <link rel="alternate" hreflang="{lang}" href="{current_url}">
     <link rel="alternate" hreflang="{other_lang}" href="{other_url}">"""
 
-    return f"""<head>
+    return [
+        f"""<head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{_html.escape(title)}</title>
@@ -222,19 +385,53 @@ def render_head(
     <!-- Canonical URL -->
     <link rel="canonical" href="{current_url}">
     
-    {extra_meta}
-    
-    <!-- Additional SEO -->
-    <meta name="author" content="{_html.escape(AUTHOR)}">
-    <meta name="robots" content="index, follow">
-    {lang_alternates}
+    """,
+        extra_meta,
+        _HEAD_SEO_META,
+        lang_alternates,
+        f"""
     
-    {css_links}
-    {head_script_tags}
-    {defer_script_tags}
-</head>"""
+    {asset_tags}
+</head>""",
+    ]
 
 
+def render_head(
+    title,
+    description,
+    lang,
+    current_url,
+    other_lang=None,
+    other_url=None,
+    extra_meta="",
+    stylesheets=None,
+    scripts_head=None,
+    scripts_defer=None,
+):
+    """Render the <head> section shared across all pages.
+
+    See _head_parts() for the arguments.
+
+    Returns:
+        str: Complete <head> HTML element.
+    """
+    return "".join(
+        _head_parts(
+            title,
+            description,
+            lang,
+            current_url,
+            other_lang,
+            other_url,
+            extra_meta,
+            stylesheets,
+            scripts_head,
+            scripts_defer,
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
 def generate_lang_toggle_html(current_lang: str, current_page: str) -> str:
     """Generate language toggle button HTML as a single unified control.
 
@@ -271,10 +468,7 @@ def generate_lang_toggle_html(current_lang: str, current_page: str) -> str:
     aria_label = switch_tpl.format(target=target_name, current=current_name)
 
     return f'''<a href="{other_lang_path}" class="lang-toggle" aria-label="{_html.escape(aria_label)}" data-current-lang="{current_lang}">
-        <svg class="lang-icon" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-            <circle cx="12" cy="12" r="10"/>
-            <path d="M2 12h20M12 2a15.3 15.3 0 0 1 4 10 15.3 15.3 0 0 1-4 10 15.3 15.3 0 0 1-4-10 15.3 15.3 0 0 1 4-10z"/>
-        </svg>
+        {_LANG_ICON_SVG}
         <span class="lang-text">
             {lang_labels_html}
         </span>
@@ -599,6 +793,38 @@ def render_presentation_slide(slide, index, total, lang="en"):
             </section>"""
 
 
+# Controls after the slide-jump form through </html>: they depend only on
+# the presentation labels and footer of a language, so they are built once.
+_presentation_page_tail_cache: dict[str, str] = {}
+
+
+def _presentation_page_tail(lang):
+    tail = _presentation_page_tail_cache.get(lang)
+    if tail is None:
+        labels = _presentation_labels(lang)
+        footer = render_footer(lang)
+        tail = f"""                <button type="button" class="presentation-control" data-presentation-action="next" aria-label="{_html.escape(labels["next"])}">
+                    <span aria-hidden="true">&rarr;</span>
+                </button>
+                <button type="button" class="presentation-control presentation-fullscreen-control"
+                        data-presentation-action="fullscreen"
+                        data-label-enter="{_html.escape(labels["fullscreen"])}"
+                        data-label-exit="{_html.escape(labels["exit_fullscreen"])}"
+                        aria-label="{_html.escape(labels["fullscreen"])}"
+                        aria-pressed="false">
+                    <span aria-hidden="true">⛶</span>
+                </button>
+            </nav>
+        </article>
+    </main>
+
+    {footer}
+</body>
+</html>"""
+        _presentation_page_tail_cache[lang] = tail
+    return tail
+
+
 def generate_presentation_html(presentation, post_number, lang="en"):
     """Generate HTML for a blog-native presentation page."""
     current_page = f"blog/{presentation['slug']}.html"
@@ -615,7 +841,7 @@ def generate_presentation_html(presentation, post_number, lang="en"):
     tags_html = ""
     if presentation.get("tags"):
         tag_pills = "".join(
-            f'<span class="tag-pill">{_html.escape(tag)}</span>' for tag in presentation["tags"]
+            [f'<span class="tag-pill">{_html.escape(tag)}</span>' for tag in presentation["tags"]]
         )
         tags_html = f'<div class="post-tags">{tag_pills}</div>'
 
@@ -675,7 +901,7 @@ def generate_presentation_html(presentation, post_number, lang="en"):
 
     {jsonld}"""
 
-    head = render_head(
+    head_parts = _head_parts(
         title=f"{presentation['title']} – {AUTHOR} | {SITE_NAME}",
         description=raw_description,
         lang=lang,
@@ -697,13 +923,13 @@ def generate_presentation_html(presentation, post_number, lang="en"):
     )
 
     nav = render_nav(lang, "blog", lang_toggle_html)
-    footer = render_footer(lang)
     skip_link = render_skip_link(lang)
     progress_text = labels["progress_text"].format(current=1, total=total_slides)
 
-    return f"""<!DOCTYPE html>
+    page_open = f"""<!DOCTYPE html>
 <html lang="{lang}">
-{head}
+"""
+    body_head = f"""
 <body>
     {skip_link}
     {nav}
@@ -763,24 +989,57 @@ def generate_presentation_html(presentation, post_number, lang="en"):
                            aria-label="{_html.escape(labels["jump"])}">
                     <button type="submit" class="presentation-jump-submit">{_html.escape(labels["jump_button"])}</button>
                 </form>
-                <button type="button" class="presentation-control" data-presentation-action="next" aria-label="{_html.escape(labels["next"])}">
-                    <span aria-hidden="true">&rarr;</span>
-                </button>
-                <button type="button" class="presentation-control presentation-fullscreen-control"
-                        data-presentation-action="fullscreen"
-                        data-label-enter="{_html.escape(labels["fullscreen"])}"
-                        data-label-exit="{_html.escape(labels["exit_fullscreen"])}"
-                        aria-label="{_html.escape(labels["fullscreen"])}"
-                        aria-pressed="false">
-                    <span aria-hidden="true">⛶</span>
-                </button>
-            </nav>
-        </article>
-    </main>
+"""
+    return "".join([page_open, *head_parts, body_head, _presentation_page_tail(lang)])
+
+
+@dataclass(slots=True)
+class PostDisplay:
+    """Escaped, localized display forms of one post in one language.
+
+    Slotted so the page and card templates read plain attributes instead of
+    hashing string keys for every field of every post.
+    """
+
+    title_upper_html: str
+    excerpt_html: str
+    tag_pills_html: str
+    published_date_display: str
 
-    {footer}
-</body>
-</html>"""
+
+def enrich_post(post, lang="en"):
+    """Return the display forms shared by a post's page and its index card.
+
+    The escaped upper-cased title, escaped excerpt, tag pills and localized
+    publication date are computed once and memoized on the post dict under
+    ``_display``.  The memo records the inputs it was derived from, so a
+    translated copy of the dict (or a different language) recomputes instead
+    of reusing stale values.
+
+    Args:
+        post (Dict): Post data with title, excerpt, tags and dates.
+        lang (str): Language code ('en' or 'pt').
+
+    Returns:
+        PostDisplay: The post's display forms for ``lang``.
+    """
+    tags = post.get("tags") or []
+    published = post.get("published_date", post.get("date", ""))
+    key = (lang, post["title"], post["excerpt"], tuple(tags), published)
+    cached = post.get("_display")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    display = PostDisplay(
+        title_upper_html=_html.escape(post["title"].upper()),
+        excerpt_html=_html.escape(post["excerpt"]),
+        tag_pills_html="".join(
+            [f'<span class="tag-pill">{_html.escape(tag)}</span>' for tag in tags]
+        ),
+        published_date_display=format_date(published, lang),
+    )
+    post["_display"] = (key, display)
+    return display
 
 
 def generate_post_html(post, post_number, lang="en"):
@@ -804,14 +1063,12 @@ def generate_post_html(post, post_number, lang="en"):
     current_page = f"blog/{post['slug']}.html"
     lang_toggle_html = generate_lang_toggle_html(lang, current_page)
     ui = LANGUAGES[lang]["ui"]
+    display = enrich_post(post, lang)
 
     # Generate tags HTML for post page
     tags_html = ""
     if post.get("tags"):
-        tag_pills = "".join(
-            f'<span class="tag-pill">{_html.escape(tag)}</span>' for tag in post["tags"]
-        )
-        tags_html = f'<div class="post-tags">{tag_pills}</div>'
+        tags_html = f'<div class="post-tags">{display.tag_pills_html}</div>'
 
     # Format last updated date -- only show if frontmatter 'updated' exists
     # and differs from 'date'. Uses editorial dates, not build timestamps.
@@ -823,7 +1080,7 @@ def generate_post_html(post, post_number, lang="en"):
         last_updated_html = f'<div class="last-updated">{ui["last_updated_label"]}: {format_date(updated_fm, lang)}</div>'
 
     # Published date for display: use frontmatter 'date' (stable, author-controlled)
-    published_date_display = format_date(post.get("published_date", post.get("date", "")), lang)
+    published_date_display = display.published_date_display
 
     # Reading time label (locale-aware)
     reading_time_raw = post.get("reading_time", 1)
@@ -890,7 +1147,7 @@ def generate_post_html(post, post_number, lang="en"):
     
     {jsonld}"""
 
-    head = render_head(
+    head_parts = _head_parts(
         title=f"{post['title']} – {AUTHOR} | {SITE_NAME}",
         description=raw_description,
         lang=lang,
@@ -902,26 +1159,18 @@ def generate_post_html(post, post_number, lang="en"):
     )
 
     nav = render_nav(lang, "blog", lang_toggle_html)
-    footer = render_footer(lang)
-    skip_link = render_skip_link(lang)
 
-    return f"""<!DOCTYPE html>
+    page_open = f"""<!DOCTYPE html>
 <html lang="{lang}">
-{head}
-<body
-    data-copy-section-link="{_html.escape(ui['copy_section_link'])}"
-    data-copy-passage-link="{_html.escape(ui['copy_passage_link'])}"
-    data-link-copied="{_html.escape(ui['link_copied'])}"
->
-    {skip_link}
-    {nav}
+"""
+    body_head = f"""{_post_body_open(lang)}{nav}
 
     <main id="main-content" class="container">
         <article class="post" style="view-transition-name: post-container-{post_number};">
             <header class="post-header">
                 <a href="{get_lang_path(lang, "index.html")}" class="back-link">{ui["back_to_blog"]}</a>
                 {last_updated_html}
-                <h1 class="post-title-large" style="view-transition-name: post-title-{post_number};">{_html.escape(post["title"].upper())}</h1>
+                <h1 class="post-title-large" style="view-transition-name: post-title-{post_number};">{display.title_upper_html}</h1>
                 <div class="post-meta">
                     <time class="post-date" style="view-transition-name: post-date-{post_number};">{published_date_display}</time>
                     <span class="post-separator">•</span>
@@ -932,16 +1181,13 @@ def generate_post_html(post, post_number, lang="en"):
 
             <div class="post-body">
                 <p class="lead" style="view-transition-name: post-excerpt-{post_number};">
-                    {_html.escape(post["excerpt"])}
+                    {display.excerpt_html}
                 </p>
-                {post["content"]}
-            </div>
-        </article>
-    </main>
-
-    {footer}
-</body>
-</html>"""
+                """
+    # The page is a list of already-built parts joined once: the <head>
+    # pieces (so extra_meta is not first copied into a head string), the
+    # per-post body header, the post body and the cached per-lang tail.
+    return "".join([page_open, *head_parts, body_head, post["content"], _post_page_tail(lang)])
 
 
 def generate_post_card(post, post_number, lang="en"):
@@ -967,19 +1213,17 @@ def generate_post_card(post, post_number, lang="en"):
             f"{_html.escape(marker)}</span>"
         )
 
+    display = enrich_post(post, lang)
     tags_html = ""
     if post.get("tags"):
-        tag_pills = "".join(
-            f'<span class="tag-pill">{_html.escape(tag)}</span>' for tag in post["tags"]
-        )
-        tags_html = f'<div class="post-tags">{content_type_marker}{tag_pills}</div>'
+        tags_html = f'<div class="post-tags">{content_type_marker}{display.tag_pills_html}</div>'
     elif content_type_marker:
         tags_html = f'<div class="post-tags">{content_type_marker}</div>'
 
     # Create data attributes for filtering and sorting
     tags_attr = _html.escape(",".join(post.get("tags", [])))
     # Canonical EN slugs for stable cross-language filter-state restoration
-    tag_keys_attr = ",".join(tag_to_slug(t) for t in post.get("en_tags", post.get("tags", [])))
+    tag_keys_attr = ",".join([tag_to_slug(t) for t in post.get("en_tags", post.get("tags", []))])
     # Use frontmatter-derived dates for client-side sort (stable, author-controlled)
     created_timestamp = post.get("published_date", post.get("date", ""))
     updated_timestamp = post.get("updated_fm_date") or post.get(
@@ -1005,17 +1249,54 @@ def generate_post_card(post, post_number, lang="en"):
                      style="view-transition-name: post-container-{post_number};">
                 <a href="{post_url}" class="post-link">
                     <div class="post-content">
-                        <h2 class="post-title" style="view-transition-name: post-title-{post_number};">{_html.escape(post["title"].upper())}</h2>
-                        <time class="post-date" style="view-transition-name: post-date-{post_number};">{format_date(post.get("published_date", post.get("date", "")), lang)}</time>
+                        <h2 class="post-title" style="view-transition-name: post-title-{post_number};">{display.title_upper_html}</h2>
+                        <time class="post-date" style="view-transition-name: post-date-{post_number};">{display.published_date_display}</time>
                         {tags_html}
                         <p class="post-excerpt" style="view-transition-name: post-excerpt-{post_number};">
-                            {_html.escape(post["excerpt"])}
+                            {display.excerpt_html}
                         </p>
                     </div>
                 </a>
             </article>"""
 
 
+# Calendar position of each English month name (post["month"]), for sorting.
+_MONTH_ORDER = {name: index for index, name in enumerate(MONTH_NAMES)}
+
+
+@dataclass(slots=True)
+class IndexFacets:
+    """Distinct years, months and tags the index filters offer, plus the
+    canonical EN slug behind each display tag.
+
+    Collected in one fused pass over the post dicts instead of one walk per
+    filter; callers sort the sets once at the end.
+    """
+
+    years: set
+    months: set[str]
+    tags: set[str]
+    tag_keys: dict[str, str]
+
+    @classmethod
+    def from_posts(cls, posts):
+        facets = cls(set(), set(), set(), {})
+        tag_keys = facets.tag_keys
+        for post in posts:
+            tags = post.get("tags") or ()
+            facets.years.add(post["year"])
+            facets.months.add(post["month"])
+            facets.tags.update(tags)
+            # For EN posts, en_tags == tags, so tag_to_slug(en_tag) is used
+            # directly.  For PT posts, en_tags holds the original EN tags at
+            # the same index as the translated PT tags, so we can recover the
+            # EN slug for each display tag.  First occurrence wins.
+            for tag, en_tag in zip(tags, post.get("en_tags", tags)):
+                if tag not in tag_keys:
+                    tag_keys[tag] = tag_to_slug(en_tag)
+        return facets
+
+
 def generate_index_html(posts, lang="en"):
     """Generate main blog index page with filtering.
 
@@ -1031,61 +1312,50 @@ def generate_index_html(posts, lang="en"):
     """
     lang_toggle_html = generate_lang_toggle_html(lang, "index.html")
     ui = LANGUAGES[lang]["ui"]
-    posts_html = "\n\n".join(generate_post_card(post, i + 1, lang) for i, post in enumerate(posts))
+    post_cards = [generate_post_card(post, i, lang) for i, post in enumerate(posts, start=1)]
 
     # Collect all unique years, months, and tags for filters (only from existing posts)
-    years = sorted(set(post["year"] for post in posts), reverse=True)
-
-    # Collect only months that have posts
-    months_with_posts = sorted(
-        set(post["month"] for post in posts),
-        key=lambda m: [
-            "January",
-            "February",
-            "March",
-            "April",
-            "May",
-            "June",
-            "July",
-            "August",
-            "September",
-            "October",
-            "November",
-            "December",
-        ].index(m),
-    )
+    facets = IndexFacets.from_posts(posts)
+    years = sorted(facets.years, reverse=True)
 
-    all_tags = sorted(set(tag for post in posts for tag in post.get("tags", [])))
+    # Collect only months that have posts, in calendar order
+    months_with_posts = sorted(facets.months, key=_MONTH_ORDER.__getitem__)
 
-    # Build display-tag -> canonical-EN-slug mapping for data-tag-key attributes.
-    # For EN posts, en_tags == tags, so tag_to_slug(en_tag) is used directly.
-    # For PT posts, en_tags holds the original EN tags at the same index as the
-    # translated PT tags, so we can recover the EN slug for each display tag.
-    tag_key_map: dict = {}
-    for post in posts:
-        pt_tags = post.get("tags", [])
-        en_tags_list = post.get("en_tags", pt_tags)
-        for pt_tag, en_tag in zip(pt_tags, en_tags_list):
-            tag_key_map.setdefault(pt_tag, tag_to_slug(en_tag))
+    all_tags = sorted(facets.tags)
 
+    # Display tag -> canonical EN slug for data-tag-key attributes.
+    tag_key_map = facets.tag_keys
+
+    # Filter controls are materialized with list comprehensions (no generator
+    # frames) before the page template, which then only substitutes them.
     # Generate year options
-    year_options = f'<div class="select-option" data-value="">{ui["all_years"]}</div>' + "".join(
-        f'<div class="select-option" data-value="{year}">{year}</div>' for year in years
+    year_options = "".join(
+        [
+            f'<div class="select-option" data-value="">{ui["all_years"]}</div>',
+            *[f'<div class="select-option" data-value="{year}">{year}</div>' for year in years],
+        ]
     )
 
     # Get month translations
     months_dict = LANGUAGES[lang].get("months", {})
 
     # Generate month options (only months with posts)
-    month_options = f'<div class="select-option" data-value="">{ui["all_months"]}</div>' + "".join(
-        f'<div class="select-option" data-value="{month}">{months_dict.get(month, month)}</div>'
-        for month in months_with_posts
+    month_options = "".join(
+        [
+            f'<div class="select-option" data-value="">{ui["all_months"]}</div>',
+            *[
+                f'<div class="select-option" data-value="{month}">{_html.escape(months_dict.get(month, month))}</div>'
+                for month in months_with_posts
+            ],
+        ]
     )
 
     # Generate tag pills for filter
     tag_pills_html = "".join(
-        f'<button class="filter-tag" data-tag="{_html.escape(tag)}" data-tag-key="{tag_key_map.get(tag, tag_to_slug(tag))}">{_html.escape(tag)}</button>'
-        for tag in all_tags
+        [
+            f'<button class="filter-tag" data-tag="{_html.escape(tag)}" data-tag-key="{tag_key_map.get(tag, tag_to_slug(tag))}">{_html.escape(tag)}</button>'
+            for tag in all_tags
+        ]
     )
 
     # Generate language-specific SEO info
@@ -1126,7 +1396,7 @@ def generate_index_html(posts, lang="en"):
     
     {jsonld}"""
 
-    head = render_head(
+    head_parts = _head_parts(
         title=f"{AUTHOR} | Blog – {SITE_NAME}",
         description=meta_description,
         lang=lang,
@@ -1138,12 +1408,12 @@ def generate_index_html(posts, lang="en"):
     )
 
     nav = render_nav(lang, "blog", lang_toggle_html)
-    footer = render_footer(lang)
     skip_link = render_skip_link(lang)
 
-    return f"""<!DOCTYPE html>
+    page_open = f"""<!DOCTYPE html>
 <html lang="{lang}">
-{head}
+"""
+    body_head = f"""
 <body>
     {skip_link}
     {nav}
@@ -1195,13 +1465,14 @@ def generate_index_html(posts, lang="en"):
         </div>
 
         <div class="posts-grid">
-{posts_html}
-        </div>
-    </main>
+"""
 
-    {footer}
-</body>
-</html>"""
+    # Joined once from parts, as in generate_post_html: the post cards
+    # dominate the page and sit between the filter header and the cached
+    # per-lang tail.
+    return "".join(
+        [page_open, *head_parts, body_head, "\n\n".join(post_cards), _index_page_tail(lang)]
+    )
 
 
 def generate_about_html(lang="en", translated_about=None):
@@ -1279,12 +1550,11 @@ def generate_about_html(lang="en", translated_about=None):
     skip_link = render_skip_link(lang)
 
     # Build about paragraphs dynamically
-    _strikethrough_re = _re.compile(r"\{\{STRIKETHROUGH:(.+?)\}\}")
-    paragraph_keys = sorted(k for k in about if k.startswith("p") and k[1:].isdigit())
+    paragraph_keys = sorted([k for k in about if k.startswith("p") and k[1:].isdigit()])
     paragraphs_html = []
     for key in paragraph_keys:
         escaped = _html.escape(about[key])
-        escaped = _strikethrough_re.sub(r'<s>\1</s>', escaped)
+        escaped = _STRIKETHROUGH_RE.sub(r'<s>\1</s>', escaped)
         paragraphs_html.append(f"                <p>{escaped}</p>")
     paragraphs_block = "\n\n".join(paragraphs_html)
 
@@ -1351,8 +1621,8 @@ def generate_cv_html(lang="en", translated_cv=None):
         "education": cv_data["education"],
     }
 
-    # Build experience HTML with achievements
-    experience_html = ""
+    # Build experience HTML with achievements (items collected, joined once)
+    experience_items = []
     for exp in cv["experience"]:
         # Build achievements list if present
         achievements_html = ""
@@ -1362,7 +1632,7 @@ def generate_cv_html(lang="en", translated_cv=None):
             )
             achievements_html = f'<ul class="cv-achievements">{achievements_items}</ul>'
 
-        experience_html += f"""
+        experience_items.append(f"""
                 <div class="cv-experience-item">
                     <div class="cv-period">{_html.escape(exp["period"])}</div>
                     <div class="cv-details">
@@ -1371,21 +1641,25 @@ def generate_cv_html(lang="en", translated_cv=None):
                         <p class="cv-description">{_html.escape(exp["description"])}</p>
                         {achievements_html}
                     </div>
-                </div>"""
+                </div>""")
+    experience_html = "".join(experience_items)
 
     # Build skills HTML - simple list format
     skills_list = " · ".join(_html.escape(s) for s in cv["skills"])
     skills_html = f'<p class="cv-skills-inline">{skills_list}</p>'
 
     # Build education HTML
-    education_html = ""
-    for edu in cv["education"]:
-        education_html += f"""
+    education_html = "".join(
+        [
+            f"""
                     <div class="cv-education-item">
                         <div class="cv-education-degree">{_html.escape(edu["degree"])}</div>
                         <div class="cv-education-school">{_html.escape(edu["school"])}</div>
                         <div class="cv-education-year">{_html.escape(edu["period"])}</div>
                     </div>"""
+            for edu in cv["education"]
+        ]
+    )
 
     # Build languages spoken HTML
     languages_html = ""
@@ -1604,7 +1878,7 @@ def generate_root_index():
 <body>
     <!-- Theme toggle (minimal, top-right corner) -->
     <button id="theme-toggle" class="theme-toggle-minimal" aria-label="{_html.escape(ui["toggle_theme"])}" style="view-transition-name: theme-toggle;">
-        {render_theme_toggle_svg()}
+        {_THEME_TOGGLE_SVG}
     </button>
 
     <!-- Landing surface -->
@@ -101,6 +101,15 @@ _INVARIANT_HEADING_PATTERNS = (
     ),
 )
 _REFERENCE_ENTRY_PREFIX = re.compile(r"^\s*(?:\[\d+\]|\d+\.|;\s*)")
+_RE_HTML_TAG = re.compile(r"<[^>]*>")
+_RE_FENCE_LINE = re.compile(r"^```", re.MULTILINE)
+_RE_OPEN_TAG = re.compile(r"<([a-zA-Z][a-zA-Z0-9]*)\b[^/>]*>")
+_RE_CLOSE_TAG = re.compile(r"</([a-zA-Z][a-zA-Z0-9]*)\s*>")
+_RE_HEADING_MARKER = re.compile(r"^#+\s*")
+_RE_BOLD_WRAPPER = re.compile(r"^\*\*\s*|\s*\*\*$")
+_RE_WHITESPACE_RUN = re.compile(r"\s+")
+_RE_WORD = re.compile(r"[a-záàâãéêíóôõúüç]+")
+_RE_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
 
 _RE_SCRIPT_TAG = re.compile(r"<\s*script[\s>].*?<\s*/\s*script\s*>", re.IGNORECASE | re.DOTALL)
 _RE_SCRIPT_OPEN = re.compile(r"<\s*script[\s>]", re.IGNORECASE)
@@ -125,7 +134,7 @@ def sanitize_translation_html(html: str) -> str:
 def sanitize_translation_text(text: str) -> str:
     """Strip HTML tags from plain-text translation fields."""
 
-    return re.sub(r"<[^>]*>", "", text)
+    return _RE_HTML_TAG.sub("", text)
 
 
 def normalize_locale(locale: str) -> str:
@@ -208,15 +217,15 @@ def validate_translation(
             else:
                 consecutive = 0
 
-    fence_count = len(re.findall(r"^```", translated_pt, re.MULTILINE))
+    fence_count = len(_RE_FENCE_LINE.findall(translated_pt))
     if fence_count % 2 != 0:
         issues.append(
             f"ERROR: unclosed fenced code block "
             f"({fence_count} ``` delimiter(s) found — expected even number)"
         )
 
-    open_tags = re.findall(r"<([a-zA-Z][a-zA-Z0-9]*)\b[^/>]*>", translated_pt)
-    close_tags = re.findall(r"</([a-zA-Z][a-zA-Z0-9]*)\s*>", translated_pt)
+    open_tags = _RE_OPEN_TAG.findall(translated_pt)
+    close_tags = _RE_CLOSE_TAG.findall(translated_pt)
     void_tags = {
         "br",
         "hr",
@@ -274,9 +283,9 @@ def _remove_glossary_terms(text: str) -> str:
 
 def _normalize_heading_candidate(text: str) -> str:
     normalized = text.strip().lower()
-    normalized = re.sub(r"^#+\s*", "", normalized)
-    normalized = re.sub(r"^\*\*\s*|\s*\*\*$", "", normalized)
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _RE_HEADING_MARKER.sub("", normalized)
+    normalized = _RE_BOLD_WRAPPER.sub("", normalized)
+    normalized = _RE_WHITESPACE_RUN.sub(" ", normalized)
     return normalized
 
 
@@ -295,9 +304,9 @@ def _is_reference_entry(text: str) -> bool:
 
 
 def _word_set(text: str) -> set[str]:
-    return {word for word in re.findall(r"[a-záàâãéêíóôõúüç]+", text.lower()) if len(word) > 1}
+    return {word for word in _RE_WORD.findall(text.lower()) if len(word) > 1}
 
 
 def _split_sentences(text: str) -> List[str]:
-    parts = re.split(r"(?<=[.!?])\s+", text.strip())
+    parts = _RE_SENTENCE_BREAK.split(text.strip())
     return [sentence.strip() for sentence in parts if sentence.strip()]
@@ -262,6 +262,7 @@ class TranslationV2PostOrchestrator:
             render_markdown_with_internal_refs(
                 translated_markdown,
                 source_markdown=content_to_translate,
+                nl2br=bool(post.get("nl2br", False)),
             )
         )
 
@@ -15,6 +15,12 @@ import hashlib
 import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 from google import genai
 from google.genai import types
 from dotenv import load_dotenv
@@ -148,6 +154,26 @@ _INVARIANT_HEADING_PATTERNS = (
     ),
 )
 _REFERENCE_ENTRY_PREFIX = re.compile(r"^\s*(?:\[\d+\]|\d+\.|;\s*)")
+_RE_HTML_TAG = re.compile(r"<[^>]*>")
+_RE_FENCE_LINE = re.compile(r"^```", re.MULTILINE)
+_RE_OPEN_TAG = re.compile(r"<([a-zA-Z][a-zA-Z0-9]*)\b[^/>]*>")
+_RE_CLOSE_TAG = re.compile(r"</([a-zA-Z][a-zA-Z0-9]*)\s*>")
+_RE_HEADING_MARKER = re.compile(r"^#+\s*")
+_RE_BOLD_WRAPPER = re.compile(r"^\*\*\s*|\s*\*\*$")
+_RE_WHITESPACE_RUN = re.compile(r"\s+")
+_RE_WORD = re.compile(r"[a-záàâãéêíóôõúüç]+")
+_RE_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+# Backtick, word characters/spaces/hyphens (2-30 chars), backtick -- but NOT
+# if preceded/followed by more backticks, which preserves code blocks (```)
+# and inline code with actual code content.
+_RE_BACKTICKED_TERM = re.compile(r"(?<!`)` *([A-Za-z][\w\s\-]{1,30}?) *`(?!`)")
+# Section header lines in agent responses.  Post headers may carry the
+# section's first line inline (TITLE: Foo); About headers stand alone.
+_RE_RESPONSE_SECTION = re.compile(
+    r"^[ \t]*(TITLE|EXCERPT|TAGS|CONTENT):(.*)$", re.IGNORECASE | re.MULTILINE
+)
+_RE_ABOUT_SECTION = re.compile(r"^[ \t]*(TITLE|P[1-4]):[ \t]*$", re.IGNORECASE | re.MULTILINE)
+_RE_OUTPUT_HEADER_LINE = re.compile(r"^[ \t]*OUTPUT:[ \t]*(?:\n|$)", re.IGNORECASE | re.MULTILINE)
 
 # ---------------------------------------------------------------------------
 # Defense-in-depth: sanitize LLM-produced HTML
@@ -203,7 +229,7 @@ def sanitize_translation_text(text: str) -> str:
     Returns:
         Cleaned text with angle-bracket sequences removed.
     """
-    return re.sub(r"<[^>]*>", "", text)
+    return _RE_HTML_TAG.sub("", text)
 
 
 def _strip_code_and_tags(text: str) -> str:
@@ -246,9 +272,9 @@ def _remove_glossary_terms(text: str) -> str:
 def _normalize_heading_candidate(text: str) -> str:
     """Normalize markdown heading-like text for invariant checks."""
     normalized = text.strip().lower()
-    normalized = re.sub(r"^#+\s*", "", normalized)
-    normalized = re.sub(r"^\*\*\s*|\s*\*\*$", "", normalized)
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _RE_HEADING_MARKER.sub("", normalized)
+    normalized = _RE_BOLD_WRAPPER.sub("", normalized)
+    normalized = _RE_WHITESPACE_RUN.sub(" ", normalized)
     return normalized
 
 
@@ -279,7 +305,7 @@ def _word_set(text: str) -> set:
     Strips punctuation and drops very short tokens (len <= 1) to reduce
     noise from articles and conjunctions.
     """
-    return {w for w in re.findall(r"[a-záàâãéêíóôõúüç]+", text.lower()) if len(w) > 1}
+    return {w for w in _RE_WORD.findall(text.lower()) if len(w) > 1}
 
 
 def _split_sentences(text: str) -> List[str]:
@@ -287,7 +313,7 @@ def _split_sentences(text: str) -> List[str]:
 
     Returns only non-empty sentences.
     """
-    parts = re.split(r"(?<=[.!?])\s+", text.strip())
+    parts = _RE_SENTENCE_BREAK.split(text.strip())
     return [s.strip() for s in parts if s.strip()]
 
 
@@ -405,7 +431,7 @@ def validate_translation(
 
     # -- 4. Malformed output checks --------------------------------------
     # 4a. Unclosed fenced code blocks (odd number of ``` delimiters)
-    fence_count = len(re.findall(r"^```", translated_pt, re.MULTILINE))
+    fence_count = len(_RE_FENCE_LINE.findall(translated_pt))
     if fence_count % 2 != 0:
         issues.append(
             f"ERROR: unclosed fenced code block "
@@ -413,8 +439,8 @@ def validate_translation(
         )
 
     # 4b. Unclosed HTML tags (very simple heuristic: opening without closing)
-    open_tags = re.findall(r"<([a-zA-Z][a-zA-Z0-9]*)\b[^/>]*>", translated_pt)
-    close_tags = re.findall(r"</([a-zA-Z][a-zA-Z0-9]*)\s*>", translated_pt)
+    open_tags = _RE_OPEN_TAG.findall(translated_pt)
+    close_tags = _RE_CLOSE_TAG.findall(translated_pt)
     # Self-closing tags (br, hr, img, etc.) don't need closing
     void_tags = {
         "br",
@@ -459,6 +485,27 @@ def validate_translation(
     return (not has_errors, issues)
 
 
+def _read_json_cache(path: Path) -> Dict:
+    """Load a JSON cache file; missing or corrupt files read as empty."""
+    try:
+        raw = path.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (ValueError, OSError):
+        # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+        return {}
+
+
+def _write_json_cache(path: Path, data: Dict) -> None:
+    """Write a JSON cache file atomically (temp file + rename)."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(payload)
+    tmp.replace(path)
+
+
 class TranslationCache:
     """Persistent cache for translated content using content hashing.
 
@@ -481,11 +528,14 @@ class TranslationCache:
 
     Attributes:
         cache (Dict): In-memory cache dictionary loaded from JSON file.
+        unchanged_stores (int): Stores skipped because the entry was already
+            identical (e.g. a forced retranslation returning the same text).
     """
 
     def __init__(self):
         """Initialize cache by loading from disk if available."""
         self.cache = self._load_cache()
+        self.unchanged_stores = 0
 
     def _load_cache(self) -> Dict:
         """Load cache from JSON file.
@@ -494,23 +544,17 @@ class TranslationCache:
             Dict: Loaded cache dictionary, or empty dict if file doesn't exist
                   or is corrupted.
         """
-        if TRANSLATION_CACHE_FILE.exists():
-            try:
-                with open(TRANSLATION_CACHE_FILE, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, OSError):
-                return {}
-        return {}
+        return _read_json_cache(TRANSLATION_CACHE_FILE)
 
     def save(self):
         """Persist cache to disk as JSON with UTF-8 encoding.
 
-        Writes the entire cache dictionary to the cache file, overwriting
-        any existing content. Uses indent=2 for human readability and
-        ensure_ascii=False to preserve Unicode characters.
+        Writes the entire cache dictionary atomically (temp file + rename),
+        so an interrupted save leaves the previous cache intact instead of a
+        truncated file. Output is 2-space-indented UTF-8 JSON, serialized
+        by orjson when it is installed.
         """
-        with open(TRANSLATION_CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.cache, f, indent=2, ensure_ascii=False)
+        _write_json_cache(TRANSLATION_CACHE_FILE, self.cache)
 
     def get_translation(self, slug: str, content_hash: str) -> Optional[Dict]:
         """Retrieve cached translation if content hasn't changed.
@@ -531,16 +575,131 @@ class TranslationCache:
     def store_translation(self, slug: str, content_hash: str, translation: Dict):
         """Store translation in cache and persist to disk.
 
+        Storing an entry identical to the cached one is a no-op.
+
         Args:
             slug (str): Post identifier.
             content_hash (str): SHA256 hash of source content.
             translation (Dict): Translation result containing title, excerpt,
                               tags, and content.
         """
-        self.cache[slug] = {"hash": content_hash, "translation": translation}
+        entry = {"hash": content_hash, "translation": translation}
+        if self.cache.get(slug) == entry:
+            self.unchanged_stores += 1
+            return
+        self.cache[slug] = entry
         self.save()
 
 
+# Rules part of the Stage 1 prompt, which only depends on the locale pair;
+# built once per direction instead of once per post.
+_translation_prompt_heads: Dict[Tuple[str, str], str] = {}
+
+_TRANSLATION_OUTPUT_FORMAT = """OUTPUT FORMAT (provide ONLY these sections, nothing else):
+
+TITLE:
+[translated title here]
+
+EXCERPT:
+[translated excerpt here]
+
+TAGS:
+[comma-separated translated tags]
+
+CONTENT:
+[full translated content with all markdown preserved]"""
+
+
+def _translation_prompt_head(source_locale: str, target_locale: str) -> str:
+    """Stage 1 prompt text up to and including the ``INPUT:`` line."""
+    cached = _translation_prompt_heads.get((source_locale, target_locale))
+    if cached is not None:
+        return cached
+
+    source = source_locale.lower()
+    target = target_locale.lower()
+
+    if target.startswith("pt"):
+        style_rule = "Write as a bilingual Brazilian engineer would naturally speak"
+        heading_rule = "TRANSLATE ALL section headings/titles to Portuguese (##, ###, etc.)"
+        lexical_rule = (
+            "TRANSLATE these common words to Portuguese: "
+            "port/ports -> porta/portas, setup -> configuracao, network -> rede, "
+            "traffic -> trafego, rule/rules -> regra/regras, mode -> modo, "
+            "alert -> alerta, blocking -> bloqueio, segmentation -> segmentacao"
+        )
+        critical_rule = (
+            "CRITICAL: English technical terms must appear as plain text within "
+            "Portuguese sentences - never wrap them in backticks, quotes, or any "
+            "other formatting"
+        )
+    elif target.startswith("en"):
+        style_rule = "Write as a bilingual software engineer would naturally speak in English"
+        heading_rule = "TRANSLATE ALL section headings/titles to English (##, ###, etc.)"
+        lexical_rule = (
+            "TRANSLATE these common words to English when they appear in Portuguese: "
+            "porta/portas -> port/ports, configuracao -> setup, rede -> network, "
+            "trafego -> traffic, regra/regras -> rule/rules, modo -> mode, "
+            "alerta -> alert, bloqueio -> blocking, segmentacao -> segmentation"
+        )
+        critical_rule = (
+            "CRITICAL: Keep technical terms as plain text in English sentences - "
+            "never wrap them in backticks, quotes, or any other formatting"
+        )
+    else:
+        style_rule = (
+            f"Write naturally for target locale {target_locale}, preserving technical "
+            "precision and tone"
+        )
+        heading_rule = f"TRANSLATE ALL section headings/titles to {target_locale} (##, ###, etc.)"
+        lexical_rule = "Translate non-technical terms naturally to the target locale."
+        critical_rule = (
+            "CRITICAL: Keep technical terms as plain text when needed - no backticks, "
+            "quotes, or extra formatting"
+        )
+
+    head = f"""Translate this technical blog post from {source} to {target}.
+
+TRANSLATION RULES:
+- Source locale: {source}
+- Target locale: {target}
+- {style_rule}
+- Keep ONLY these technical terms in English (no special formatting): GPU, CUDA, API, ML, AI, machine learning, deep learning, backend, frontend, framework, pipeline, cache, build, deploy, commit, debug, kernel, thread, hardware, software, benchmark, throughput, latency, overhead, runtime, tooling, workflow, endpoint, payload, metadata
+- {lexical_rule}
+- {heading_rule}
+- {critical_rule}
+- Preserve ALL Markdown syntax, code blocks, and formatting EXACTLY
+- Do NOT add explanations, notes, or JSON blocks
+- Output ONLY the sections below in the exact format shown
+
+INPUT:
+"""
+    _translation_prompt_heads[(source_locale, target_locale)] = head
+    return head
+
+
+def _response_sections(pattern: re.Pattern, text: str) -> List[Tuple[str, str, List[str]]]:
+    """Split an agent response into sections in one pass over its headers.
+
+    ``pattern`` matches a whole section header line: group 1 is the section
+    name and an optional group 2 is text on the header line itself.  Text
+    before the first header is ignored.
+
+    Returns:
+        List[Tuple[str, str, List[str]]]: (lower-cased section name, stripped
+        header-line text, lines below the header up to the next one).
+    """
+    headers = list(pattern.finditer(text))
+    ends = [match.start() for match in headers[1:]] + [len(text) + 1]
+    sections = []
+    for match, end in zip(headers, ends):
+        start = match.end() + 1  # skip the header's newline
+        lines = text[start : end - 1].split("\n") if start < end else []
+        inline = (match.group(2) or "").strip() if pattern.groups > 1 else ""
+        sections.append((match.group(1).lower(), inline, lines))
+    return sections
+
+
 class MultiAgentTranslator:
     """Three-stage translation pipeline using Gemini API with model fallback.
 
@@ -636,13 +795,8 @@ class MultiAgentTranslator:
         Returns:
             str: Text with backticks removed from isolated technical terms.
         """
-        # Pattern: backtick, word characters/spaces/hyphens (2-30 chars), backtick
-        # But NOT if preceded/followed by more backticks (code blocks)
-        # This preserves code blocks (```) and inline code with actual code content
-        pattern = r"(?<!`)` *([A-Za-z][\w\s\-]{1,30}?) *`(?!`)"
-
         # Replace backticks around simple technical terms
-        cleaned = re.sub(pattern, r"\1", text)
+        cleaned = _RE_BACKTICKED_TERM.sub(r"\1", text)
 
         return cleaned
 
@@ -1128,85 +1282,13 @@ class MultiAgentTranslator:
         excerpt = frontmatter.get("excerpt", "")
         tags = ", ".join(frontmatter.get("tags", []))
 
-        source = source_locale.lower()
-        target = target_locale.lower()
-
-        if target.startswith("pt"):
-            style_rule = "Write as a bilingual Brazilian engineer would naturally speak"
-            heading_rule = "TRANSLATE ALL section headings/titles to Portuguese (##, ###, etc.)"
-            lexical_rule = (
-                "TRANSLATE these common words to Portuguese: "
-                "port/ports -> porta/portas, setup -> configuracao, network -> rede, "
-                "traffic -> trafego, rule/rules -> regra/regras, mode -> modo, "
-                "alert -> alerta, blocking -> bloqueio, segmentation -> segmentacao"
-            )
-            critical_rule = (
-                "CRITICAL: English technical terms must appear as plain text within "
-                "Portuguese sentences - never wrap them in backticks, quotes, or any "
-                "other formatting"
-            )
-        elif target.startswith("en"):
-            style_rule = "Write as a bilingual software engineer would naturally speak in English"
-            heading_rule = "TRANSLATE ALL section headings/titles to English (##, ###, etc.)"
-            lexical_rule = (
-                "TRANSLATE these common words to English when they appear in Portuguese: "
-                "porta/portas -> port/ports, configuracao -> setup, rede -> network, "
-                "trafego -> traffic, regra/regras -> rule/rules, modo -> mode, "
-                "alerta -> alert, bloqueio -> blocking, segmentacao -> segmentation"
-            )
-            critical_rule = (
-                "CRITICAL: Keep technical terms as plain text in English sentences - "
-                "never wrap them in backticks, quotes, or any other formatting"
-            )
-        else:
-            style_rule = (
-                f"Write naturally for target locale {target_locale}, preserving technical "
-                "precision and tone"
-            )
-            heading_rule = (
-                f"TRANSLATE ALL section headings/titles to {target_locale} (##, ###, etc.)"
-            )
-            lexical_rule = "Translate non-technical terms naturally to the target locale."
-            critical_rule = (
-                "CRITICAL: Keep technical terms as plain text when needed - no backticks, "
-                "quotes, or extra formatting"
-            )
-
-        return f"""Translate this technical blog post from {source} to {target}.
-
-TRANSLATION RULES:
-- Source locale: {source}
-- Target locale: {target}
-- {style_rule}
-- Keep ONLY these technical terms in English (no special formatting): GPU, CUDA, API, ML, AI, machine learning, deep learning, backend, frontend, framework, pipeline, cache, build, deploy, commit, debug, kernel, thread, hardware, software, benchmark, throughput, latency, overhead, runtime, tooling, workflow, endpoint, payload, metadata
-- {lexical_rule}
-- {heading_rule}
-- {critical_rule}
-- Preserve ALL Markdown syntax, code blocks, and formatting EXACTLY
-- Do NOT add explanations, notes, or JSON blocks
-- Output ONLY the sections below in the exact format shown
-
-INPUT:
-Title: {title}
-Excerpt: {excerpt}
-Tags: {tags}
-
-Content:
-{content}
-
-OUTPUT FORMAT (provide ONLY these sections, nothing else):
-
-TITLE:
-[translated title here]
-
-EXCERPT:
-[translated excerpt here]
-
-TAGS:
-[comma-separated translated tags]
-
-CONTENT:
-[full translated content with all markdown preserved]"""
+        return "".join(
+            [
+                _translation_prompt_head(source_locale, target_locale),
+                f"Title: {title}\nExcerpt: {excerpt}\nTags: {tags}\n\nContent:\n{content}\n\n",
+                _TRANSLATION_OUTPUT_FORMAT,
+            ]
+        )
 
     def _build_critique_prompt(
         self,
@@ -1314,10 +1396,12 @@ CONTENT:
 
         Handles multiple output formats:
         1. Section headers on separate lines (TITLE:\\n[text])
-        2. Inline sections (TITLE: [text])
-        3. Stops parsing at JSON blocks, code fences, or explanatory text
+        2. Inline sections (TITLE: [text]); CONTENT: text is always taken
+           from the lines below the header
+        3. A bare OUTPUT: header line anywhere is ignored
 
-        Falls back to original values if sections are missing/empty.
+        Falls back to original values if sections are missing/empty. When a
+        section appears more than once, the last non-empty one wins.
 
         Args:
             response (str): API response text with structured sections.
@@ -1333,85 +1417,18 @@ CONTENT:
             "content": "",
         }
 
-        lines = response.strip().split("\n")
-        current = None
-        buffer = []
-
-        for line in lines:
-            stripped = line.strip()
-            upper = stripped.upper()
-
-            # Skip empty lines when not in a section
-            if not stripped and not current:
-                continue
-
-            # Skip "OUTPUT:" header if present
-            if upper == "OUTPUT:":
-                continue
-
-            # Check for section markers (with or without trailing content)
-            if upper.startswith("TITLE:"):
-                # Save previous section
-                if current == "content" and buffer:
-                    result["content"] = "\n".join(buffer).strip()
-                elif current == "excerpt" and buffer:
-                    result["excerpt"] = " ".join(buffer).strip()
-                elif current == "tags" and buffer:
-                    result["tags"] = [t.strip() for t in " ".join(buffer).split(",") if t.strip()]
-
-                current = "title"
-                buffer = []
-                # Check if title is on same line
-                if len(stripped) > 6:
-                    title_text = stripped[6:].strip()
-                    if title_text:
-                        buffer.append(title_text)
+        text = _RE_OUTPUT_HEADER_LINE.sub("", response.strip()).rstrip("\n")
+        for name, inline, lines in _response_sections(_RE_RESPONSE_SECTION, text):
+            if inline and name != "content":
+                lines.insert(0, inline)
+            if not lines:
                 continue
-
-            elif upper.startswith("EXCERPT:"):
-                if current == "title" and buffer:
-                    result["title"] = " ".join(buffer).strip()
-                current = "excerpt"
-                buffer = []
-                # Check if excerpt is on same line
-                if len(stripped) > 8:
-                    excerpt_text = stripped[8:].strip()
-                    if excerpt_text:
-                        buffer.append(excerpt_text)
-                continue
-
-            elif upper.startswith("TAGS:"):
-                if current == "excerpt" and buffer:
-                    result["excerpt"] = " ".join(buffer).strip()
-                current = "tags"
-                buffer = []
-                # Check if tags are on same line
-                if len(stripped) > 5:
-                    tags_text = stripped[5:].strip()
-                    if tags_text:
-                        buffer.append(tags_text)
-                continue
-
-            elif upper.startswith("CONTENT:"):
-                if current == "tags" and buffer:
-                    result["tags"] = [t.strip() for t in " ".join(buffer).split(",") if t.strip()]
-                current = "content"
-                buffer = []
-                continue
-
-            # Accumulate content for current section
-            if current:
-                buffer.append(line)
-
-        # Process final section
-        if current == "content" and buffer:
-            result["content"] = "\n".join(buffer).strip()
-        elif current == "title" and buffer:
-            result["title"] = " ".join(buffer).strip()
-        elif current == "excerpt" and buffer:
-            result["excerpt"] = " ".join(buffer).strip()
-        elif current == "tags" and buffer:
-            result["tags"] = [t.strip() for t in " ".join(buffer).split(",") if t.strip()]
+            if name == "content":
+                result["content"] = "\n".join(lines).strip()
+            elif name == "tags":
+                result["tags"] = [t.strip() for t in " ".join(lines).split(",") if t.strip()]
+            else:
+                result[name] = " ".join(lines).strip()
 
         return result
 
@@ -1522,44 +1539,9 @@ P4:
             "p4": original.get("p4", ""),
         }
 
-        lines = response.strip().split("\n")
-        current = None
-        buffer = []
-
-        for line in lines:
-            upper = line.strip().upper()
-
-            if upper == "TITLE:":
-                if current and buffer:
-                    result[current] = "\n".join(buffer).strip()
-                current = "title"
-                buffer = []
-            elif upper == "P1:":
-                if current == "title" and buffer:
-                    result["title"] = " ".join(buffer).strip()
-                current = "p1"
-                buffer = []
-            elif upper == "P2:":
-                if current and buffer:
-                    result[current] = "\n".join(buffer).strip()
-                current = "p2"
-                buffer = []
-            elif upper == "P3:":
-                if current and buffer:
-                    result[current] = "\n".join(buffer).strip()
-                current = "p3"
-                buffer = []
-            elif upper == "P4:":
-                if current and buffer:
-                    result[current] = "\n".join(buffer).strip()
-                current = "p4"
-                buffer = []
-            else:
-                if current:
-                    buffer.append(line)
-
-        if current and buffer:
-            result[current] = "\n".join(buffer).strip()
+        for name, _, lines in _response_sections(_RE_ABOUT_SECTION, response.strip()):
+            if lines:
+                result[name] = (" " if name == "title" else "\n").join(lines).strip()
 
         return result
 
@@ -1870,27 +1852,23 @@ SUMMARY:
         if not translated:
             return None
 
-        # Build translated post from translation results (works for both new and cached)
-        translated_post = post.copy()
-        translated_post["lang"] = target_locale
-        translated_post["title"] = sanitize_translation_text(translated.get("title", post["title"]))
-        translated_post["excerpt"] = sanitize_translation_text(
-            translated.get("excerpt", post["excerpt"])
-        )
-        translated_post["tags"] = [
-            sanitize_translation_text(t) for t in translated.get("tags", post["tags"])
-        ]
-
         # Convert translated markdown to HTML, then sanitize
         translated_markdown = translated.get("content", post.get("raw_content", ""))
         translated_html = render_markdown_with_internal_refs(
             translated_markdown,
             source_markdown=content_to_translate,
+            nl2br=bool(post.get("nl2br", False)),
         )
-        translated_post["raw_content"] = translated_markdown
-        translated_post["content"] = sanitize_translation_html(translated_html)
 
-        return translated_post
+        return {
+            **post,
+            "lang": target_locale,
+            "title": sanitize_translation_text(translated.get("title", post["title"])),
+            "excerpt": sanitize_translation_text(translated.get("excerpt", post["excerpt"])),
+            "tags": [sanitize_translation_text(t) for t in translated.get("tags", post["tags"])],
+            "raw_content": translated_markdown,
+            "content": sanitize_translation_html(translated_html),
+        }
 
 
 def translate_if_needed(
@@ -0,0 +1,21 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolate_build_caches(tmp_path, monkeypatch):
+    """Keep every test's build caches and run logs under tmp_path, not the checkout."""
+    cache_dir = tmp_path / "_cache"
+    monkeypatch.setenv("TRANSLATION_V2_ARTIFACT_BASE_DIR", str(cache_dir / "translation-runs"))
+    # build imports the paths by name, so patch the module once a test file has loaded it.
+    build = sys.modules.get("build")
+    if build is not None:
+        monkeypatch.setattr(build, "MARKDOWN_CACHE_DIR", cache_dir / "markdown-html")
+        monkeypatch.setattr(build, "PARSED_POSTS_DIR", cache_dir / "parsed-posts")
+        monkeypatch.setattr(build, "TRANSLATED_POSTS_DIR", cache_dir / "translated-posts")
+        monkeypatch.setattr(build, "ensure_dirs", lambda: None)
@@ -8,6 +8,7 @@ import json
 import sys
 import os
 import types
+from datetime import date
 from pathlib import Path
 from unittest import mock
 
@@ -111,6 +112,11 @@ class TestCalculateReadingTime:
         # Even for very short content, minimum is 1
         assert build.calculate_reading_time("hi") >= 1
 
+    def test_whitespace_runs_count_as_one_gap(self):
+        # 300 words: an approximate space/newline count would see 600 and say 3
+        content = "  \n".join(["word"] * 300)
+        assert build.calculate_reading_time(content) == 2
+
 
 # ---------------------------------------------------------------------------
 # format_reading_time
@@ -165,6 +171,18 @@ class TestFormatDate:
         result = build.format_date("2024-03-05", "en")
         assert result == "March 05, 2024"
 
+    def test_date_object_and_unpadded_string(self):
+        assert build.format_date(date(2024, 3, 5), "en") == "March 05, 2024"
+        assert build.format_date("2024-3-5", "en") == "March 05, 2024"
+        assert build.format_date("24-3-5", "en") == "24-3-5"
+        assert build.format_date("2024-3-32", "en") == "2024-3-32"
+
+    def test_repeated_inputs_are_memoized(self):
+        build.format_date("2023-08-09", "pt")
+        hits = build.format_date.cache_info().hits
+        assert build.format_date("2023-08-09", "pt") == "09 de Agosto de 2023"
+        assert build.format_date.cache_info().hits == hits + 1
+
 
 # ---------------------------------------------------------------------------
 # format_iso_date
@@ -296,6 +314,30 @@ class TestBuildFlagHelpers:
         assert by_slug == [Path("/tmp/second-post.md")]
         assert by_file == [Path("/tmp/first-post.md")]
 
+    def test_list_post_sources_matches_glob(self, tmp_path):
+        for name in ("b.md", "a.md", ".hidden.md", "notes.txt"):
+            (tmp_path / name).write_text("x", encoding="utf-8")
+        (tmp_path / "dir.md").mkdir()
+        assert build._list_post_sources(tmp_path) == [tmp_path / "a.md", tmp_path / "b.md"]
+        assert build._list_post_sources(tmp_path / "missing") == []
+
+    def test_parse_source_post_returns_manifest_updates_instead_of_mutating(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.setattr(build, "PARSED_POSTS_DIR", tmp_path / "parsed")
+        source = tmp_path / "post.md"
+        source.write_text("---\ntitle: T\ndate: 2024-01-15\n---\nbody", encoding="utf-8")
+        store = {"post": {"content_hash": "stale", "created_at": "c", "updated_at": "u"}}
+        before = json.dumps(store, sort_keys=True)
+
+        post, updates = build._parse_source_post(source, store, True)
+        assert json.dumps(store, sort_keys=True) == before
+        assert updates["post"]["content_hash"] == post["content_hash"]
+        assert "post.md" in updates[build.PARSED_SOURCES_KEY]
+
+        build._merge_manifest_updates(store, updates)
+        assert build._parse_source_post(source, store, True) == (post, {})
+
 
 # ---------------------------------------------------------------------------
 # render_theme_toggle_svg
@@ -444,6 +486,11 @@ class TestGenerateLangToggleHtml:
         result = build.generate_lang_toggle_html("en", "blog/my-post.html")
         assert "blog/my-post.html" in result
 
+    def test_memoized_per_lang_and_page(self):
+        first = build.generate_lang_toggle_html("pt", "blog/cached.html")
+        assert build.generate_lang_toggle_html("pt", "blog/cached.html") is first
+        assert build.generate_lang_toggle_html("en", "blog/cached.html") != first
+
 
 # ---------------------------------------------------------------------------
 # render_nav
@@ -469,6 +516,13 @@ class TestRenderNav:
         assert "SOBRE" in result  # PT for "ABOUT"
         assert "BLOG" in result
 
+    def test_cached_frame_keeps_active_page_and_toggle_apart(self):
+        about = build.render_nav("en", "about", "<a>one</a>")
+        cv = build.render_nav("en", "cv", "<a>two</a>")
+        assert "<a>one</a>" in about and "<a>one</a>" not in cv
+        assert about.count('class="active"') == cv.count('class="active"') == 1
+        assert build.render_nav("en", "about", "<a>one</a>") == about
+
 
 # ---------------------------------------------------------------------------
 # render_footer
@@ -495,6 +549,16 @@ class TestRenderFooter:
         assert 'aria-label="GitHub"' in result
         assert 'aria-label="LinkedIn"' in result
 
+    def test_icons_reference_shared_sprite(self):
+        result = build.render_footer("en")
+        sprite = (build.PROJECT_ROOT / "static" / "images" / "social-icons.svg").read_text(
+            encoding="utf-8"
+        )
+        for icon in ("twitter", "github", "linkedin"):
+            assert "social-icons.svg?v=" in result and f'#{icon}"' in result
+            assert f'<symbol id="{icon}"' in sprite
+        assert "<path" not in result
+
 
 # ---------------------------------------------------------------------------
 # generate_post_card
@@ -572,3 +636,258 @@ class TestGeneratePostCard:
         assert "&lt;SCRIPT&gt;" in result
         assert "&amp;" in result
         assert "&quot;" in result
+
+
+# ---------------------------------------------------------------------------
+# Render fingerprint skip (incremental post output)
+# ---------------------------------------------------------------------------
+
+
+class TestRenderFingerprintSkip:
+    SAMPLE_POST = TestGeneratePostCard.SAMPLE_POST
+
+    def _commit(self, tmp_path, rendered_outputs, post=None, staging_dir=None):
+        post = post or self.SAMPLE_POST
+        with mock.patch.dict(build.LANG_DIRS, {"en": tmp_path / "en"}), mock.patch.object(
+            build, "generate_post_html", return_value="<html></html>"
+        ) as render:
+            build._commit_source_post_output(
+                post,
+                lang_key="en",
+                posts_for_lang=[post],
+                staging_dir=staging_dir,
+                rendered_outputs=rendered_outputs,
+            )
+        return render
+
+    def test_unchanged_post_is_not_rerendered(self, tmp_path):
+        rendered = {}
+        assert self._commit(tmp_path, rendered).call_count == 1
+        assert "en/blog/test-post.html" in rendered
+        assert self._commit(tmp_path, rendered).call_count == 0
+
+    def test_changed_post_is_rerendered(self, tmp_path):
+        rendered = {}
+        self._commit(tmp_path, rendered)
+        edited = {**self.SAMPLE_POST, "title": "Edited"}
+        assert self._commit(tmp_path, rendered, post=edited).call_count == 1
+
+    def test_rerender_with_identical_bytes_is_logged_unchanged(self, tmp_path):
+        rendered = {}
+        self._commit(tmp_path, rendered)
+        edited = {**self.SAMPLE_POST, "title": "Edited"}
+        with mock.patch.object(build, "log_line") as log:
+            assert self._commit(tmp_path, rendered, post=edited).call_count == 1
+        log.assert_called_once_with("unchanged: en/blog/test-post.html", indent=2)
+
+    def test_pool_render_leaves_logging_and_fingerprints_to_the_caller(self, tmp_path):
+        rendered = {}
+        with mock.patch.dict(build.LANG_DIRS, {"en": tmp_path / "en"}), mock.patch.object(
+            build, "generate_post_html", return_value="<html></html>"
+        ), mock.patch.object(build, "log_line") as log:
+            result = build._render_source_post_output(
+                self.SAMPLE_POST,
+                lang_key="en",
+                posts_for_lang=[self.SAMPLE_POST],
+                staging_dir=None,
+                rendered_outputs=rendered,
+            )
+        assert rendered == {}
+        log.assert_not_called()
+        assert result[0] == "en/blog/test-post.html"
+        assert result[2] is True
+
+    def test_missing_output_is_rerendered(self, tmp_path):
+        rendered = {}
+        self._commit(tmp_path, rendered)
+        (tmp_path / "en" / "blog" / "test-post.html").unlink()
+        assert self._commit(tmp_path, rendered).call_count == 1
+
+    def test_template_change_forces_rerender(self, tmp_path, monkeypatch):
+        rendered = {}
+        self._commit(tmp_path, rendered)
+        monkeypatch.setattr(build, "_template_hash", lambda: "changed")
+        monkeypatch.setattr(build, "_render_salt_cache", {})
+        assert self._commit(tmp_path, rendered).call_count == 1
+
+    def test_static_assets_are_keyed_by_relative_path(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(build, "STATIC_DIR", tmp_path)
+        monkeypatch.setattr(build, "_render_salt_cache", {})
+        asset = tmp_path / "css" / "site.css"
+        asset.parent.mkdir()
+        asset.write_text("x", encoding="utf-8")
+        os.utime(asset, ns=(0, 0))
+        before = build._render_salt()
+
+        moved = tmp_path / "js" / "site.css"
+        moved.parent.mkdir()
+        asset.rename(moved)
+        build._render_salt_cache.clear()
+        assert build._render_salt() != before
+
+    def test_staged_builds_always_render(self, tmp_path):
+        output = tmp_path / "page.html"
+        output.write_text("x", encoding="utf-8")
+        rendered = {"en/blog/page.html": "fp"}
+        assert build._render_is_current(rendered, "en/blog/page.html", "fp", output, None)
+        assert not build._render_is_current(
+            rendered, "en/blog/page.html", "fp", output, tmp_path / "_staging"
+        )
+
+
+class TestWriteOutputFile:
+    def test_identical_content_is_not_rewritten(self, tmp_path):
+        target = tmp_path / "page.html"
+        with mock.patch.object(build, "_out", return_value=target):
+            build._write_output_file(target, "<p>é</p>", None)
+            mtime = target.stat().st_mtime_ns
+            with mock.patch.object(build, "_write_bytes") as write:
+                assert build._write_output_file(target, "<p>é</p>", None) is False
+                write.assert_not_called()
+            assert build._write_output_file(target, "<p>e</p>", None) is True
+            assert build._write_output_file(target, "<p>f</p>", None) is True  # same size
+        assert target.read_text(encoding="utf-8") == "<p>f</p>"
+        assert mtime <= target.stat().st_mtime_ns
+
+    def test_precompress_writes_stable_gzip_sibling(self, tmp_path, monkeypatch):
+        import gzip
+
+        monkeypatch.setattr(build, "brotli", None)
+        target = tmp_path / "page.html"
+        with mock.patch.object(build, "_out", return_value=target):
+            build._write_output_file(target, "<p>é</p>", None, precompress=True)
+            first = (tmp_path / "page.html.gz").read_bytes()
+            with mock.patch.object(build, "_write_bytes") as write:
+                build._write_output_file(target, "<p>é</p>", None, precompress=True)
+                write.assert_not_called()
+        assert gzip.decompress(first) == "<p>é</p>".encode("utf-8")
+        assert build._gzip_bytes("<p>é</p>".encode("utf-8")) == first
+        assert not (tmp_path / "page.html.br").exists()
+
+    def test_build_without_precompress_removes_stale_siblings(self, tmp_path):
+        target = tmp_path / "page.html"
+        with mock.patch.object(build, "_out", return_value=target):
+            build._write_output_file(target, "<p>é</p>", None, precompress=True)
+            (tmp_path / "page.html.br").write_bytes(b"stale")
+            build._write_output_file(target, "<p>é</p>", None)
+        assert target.exists()
+        assert not (tmp_path / "page.html.gz").exists()
+        assert not (tmp_path / "page.html.br").exists()
+
+    def test_missing_sibling_forces_rerender(self, tmp_path):
+        target = tmp_path / "page.html"
+        target.write_text("x", encoding="utf-8")
+        outputs = {"en/blog/page.html": "fp"}
+        assert build._render_is_current(outputs, "en/blog/page.html", "fp", target, None)
+        assert not build._render_is_current(
+            outputs, "en/blog/page.html", "fp", target, None, precompress=True
+        )
+
+
+class TestEnrichPost:
+    SAMPLE_POST = TestGeneratePostCard.SAMPLE_POST
+
+    def test_memoized_on_post(self):
+        post = dict(self.SAMPLE_POST)
+        first = build.enrich_post(post, "en")
+        assert build.enrich_post(post, "en") is first
+        assert first.title_upper_html == "TEST POST TITLE"
+
+    def test_translated_copy_is_recomputed(self):
+        post = dict(self.SAMPLE_POST)
+        build.enrich_post(post, "en")
+        translated = {**post, "title": "Título", "tags": ["pitão"]}
+        display = build.enrich_post(translated, "pt")
+        assert display.title_upper_html == "TÍTULO"
+        assert "pitão" in display.tag_pills_html
+        assert display.published_date_display == "15 de Junho de 2024"
+
+
+class TestIndexFilters:
+    SAMPLE_POST = {**TestGeneratePostCard.SAMPLE_POST, "month": "June"}
+
+    def test_translated_tags_keep_english_filter_keys(self):
+        posts = [
+            {**self.SAMPLE_POST, "tags": ["pitão", "rede"], "en_tags": ["Python", "Web"]},
+            {**self.SAMPLE_POST, "slug": "b", "year": "2023", "month": "March", "tags": ["rede"]},
+        ]
+        html = build.generate_index_html(posts, lang="pt")
+        assert 'data-tag="pitão" data-tag-key="python"' in html
+        assert 'data-tag="rede" data-tag-key="web"' in html
+        assert html.index('data-value="2024"') < html.index('data-value="2023"')
+        assert html.index('data-value="March"') < html.index('data-value="June"')
+
+
+class TestReusedTranslation:
+    SAMPLE_POST = TestGeneratePostCard.SAMPLE_POST
+
+    def test_roundtrip_until_source_post_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(build, "TRANSLATED_POSTS_DIR", tmp_path)
+        reused = {}
+        key = "pt/blog/test-post.html"
+        signature = build._translation_signature(self.SAMPLE_POST, "pt-br", "salt")
+        translated = {**self.SAMPLE_POST, "lang": "pt-br", "title": "Título"}
+
+        build._store_reused_translation(
+            reused, key, signature, translated, lang_key="pt", slug="test-post"
+        )
+        assert (
+            build._load_reused_translation(
+                reused, key, signature, lang_key="pt", slug="test-post"
+            )
+            == translated
+        )
+
+        edited = {**self.SAMPLE_POST, "excerpt": "Edited"}
+        for changed in (
+            build._translation_signature(edited, "pt-br", "salt"),
+            build._translation_signature(self.SAMPLE_POST, "pt-br", "other-salt"),
+        ):
+            assert changed != signature
+            assert (
+                build._load_reused_translation(
+                    reused, key, changed, lang_key="pt", slug="test-post"
+                )
+                is None
+            )
+
+    def test_salt_ignores_translation_cache_writes(self, tmp_path, monkeypatch):
+        cache_file = tmp_path / "translation-cache.json"
+        monkeypatch.setattr(build, "TRANSLATION_CACHE", cache_file)
+        monkeypatch.delenv("TRANSLATION_V2_PROMPT_VERSION", raising=False)
+        salt = build._translation_state_salt("opencode")
+
+        cache_file.write_text('{"other-post": {}}', encoding="utf-8")
+        assert build._translation_state_salt("opencode") == salt
+
+        monkeypatch.setenv("TRANSLATION_V2_PROMPT_VERSION", "v3")
+        assert build._translation_state_salt("opencode") != salt
+
+    def test_stale_listings_are_committed_once_and_cleared(self, monkeypatch):
+        index = mock.Mock()
+        sitemap = mock.Mock()
+        monkeypatch.setattr(build, "_commit_language_index", index)
+        monkeypatch.setattr(build, "_commit_sitemap_output", sitemap)
+        stale = {"pt"}
+        posts = {"en": [self.SAMPLE_POST], "pt": []}
+
+        build._commit_translated_listings(stale, posts, None)
+
+        index.assert_called_once_with(
+            posts=[], lang_key="pt", staging_dir=None, source_build=False, precompress=False
+        )
+        sitemap.assert_called_once()
+        assert stale == set()
+
+    def test_post_number_matches_newest_first_order_with_date_ties(self):
+        posts = [
+            {"slug": "a", "published_date": "2024-01-01"},
+            {"slug": "b", "published_date": "2024-03-01"},
+            {"slug": "c", "published_date": "2024-01-01"},
+            {"slug": "d", "date": "2023-12-31"},
+        ]
+        expected = [post["slug"] for post in build._sorted_posts(posts)]
+
+        numbers = {post["slug"]: build._post_number(post, posts) for post in posts}
+
+        assert sorted(numbers, key=numbers.get) == expected
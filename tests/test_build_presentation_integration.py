@@ -124,8 +124,8 @@ def _configure(monkeypatch, tmp_path: Path):
     monkeypatch.setattr(build, "generate_about_html", lambda *a, **k: "<html>about</html>")
     monkeypatch.setattr(build, "generate_cv_html", lambda *a, **k: "<html>cv</html>")
     monkeypatch.setattr(build, "generate_root_index", lambda: "<html>root</html>")
-    monkeypatch.setattr(build, "TranslationV2PostOrchestrator", lambda **_: _FakePresentationOrchestrator())
-    monkeypatch.setattr(build, "validate_translation", lambda *a, **k: (True, []))
+    monkeypatch.setattr("translation_v2.TranslationV2PostOrchestrator", lambda **_: _FakePresentationOrchestrator())
+    monkeypatch.setattr("translation_common.validate_translation", lambda *a, **k: (True, []))
 
     validate_mod = types.ModuleType("validate")
     validate_mod.run_validation = lambda *_a, **_k: True  # type: ignore[attr-defined]
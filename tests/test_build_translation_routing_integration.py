@@ -3,6 +3,7 @@
 import os
 import sys
 import types
+import threading
 from pathlib import Path
 
 
@@ -154,7 +155,7 @@ def _configure_build_for_test(tmp_path: Path, monkeypatch, source_post: dict):
     monkeypatch.setattr(build, "load_post_metadata", lambda: {})
     monkeypatch.setattr(build, "save_post_metadata", lambda *_: None)
     monkeypatch.setattr(build, "load_cv_data", lambda: {"name": "x"})
-    monkeypatch.setattr(build, "TranslationV2PostOrchestrator", lambda **_: _FakePostOrchestrator())
+    monkeypatch.setattr("translation_v2.TranslationV2PostOrchestrator", lambda **_: _FakePostOrchestrator())
 
     def _parse_markdown_post(filepath, _metadata_store=None):  # noqa: ARG001
         return source_post.copy()
@@ -209,7 +210,7 @@ def test_build_validates_pt_br_to_en_us_with_locale_direction(monkeypatch, tmp_p
         )
         return (True, [])
 
-    monkeypatch.setattr(build, "validate_translation", _fake_validate)
+    monkeypatch.setattr("translation_common.validate_translation", _fake_validate)
 
     ok = build.build(strict=False, use_staging=False, skip_about_cv_translation=True)
 
@@ -224,8 +225,7 @@ def test_strict_build_fails_on_pt_br_to_en_us_validation_error(monkeypatch, tmp_
     _configure_build_for_test(tmp_path, monkeypatch, source_post)
 
     monkeypatch.setattr(
-        build,
-        "validate_translation",
+        "translation_common.validate_translation",
         lambda *_a, **_k: (False, ["ERROR: paragraph 1 appears untranslated"]),
     )
 
@@ -320,3 +320,44 @@ def test_about_cv_translation_runs_without_skip_flag(monkeypatch, tmp_path):
     ok = build.build(strict=False, use_staging=False, skip_about_cv_translation=False)
 
     assert ok is True
+
+
+def test_build_with_every_translation_reused_never_starts_the_orchestrator(
+    monkeypatch, tmp_path, capsys
+):
+    source_post = _mk_post("en-source", "en-us")
+    _configure_build_for_test(tmp_path, monkeypatch, source_post)
+    (tmp_path / "pt" / "blog" / "en-source.html").write_text("previous", encoding="utf-8")
+    monkeypatch.setattr(
+        build, "_load_reused_translation", lambda *a, **k: _mk_post("en-source", "pt-br")
+    )
+
+    def _fail(**_):
+        raise AssertionError("orchestrator started without anything to translate")
+
+    monkeypatch.setattr("translation_v2.TranslationV2PostOrchestrator", _fail)
+
+    ok = build.build(
+        strict=False, use_staging=False, skip_about_cv_translation=True, incremental=True
+    )
+    assert ok is True
+    assert (tmp_path / "pt" / "blog" / "en-source.html").read_text(encoding="utf-8") != "previous"
+    assert "Reused unchanged" in capsys.readouterr().out
+
+
+def test_render_pool_results_are_logged_from_the_main_thread(monkeypatch, tmp_path):
+    source_post = _mk_post("en-source", "en-us")
+    _configure_build_for_test(tmp_path, monkeypatch, source_post)
+    log_threads = []
+    real_log_line = build.log_line
+
+    def _log_line(*args, **kwargs):
+        log_threads.append(threading.current_thread())
+        real_log_line(*args, **kwargs)
+
+    monkeypatch.setattr(build, "log_line", _log_line)
+
+    ok = build.build(strict=False, use_staging=False, skip_about_cv_translation=True)
+    assert ok is True
+    assert log_threads
+    assert set(log_threads) == {threading.main_thread()}
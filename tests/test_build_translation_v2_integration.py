@@ -579,7 +579,7 @@ def _configure(
         orchestrators.append(orchestrator)
         return orchestrator
 
-    monkeypatch.setattr(build, "TranslationV2PostOrchestrator", _fake_orchestrator_factory)
+    monkeypatch.setattr("translation_v2.TranslationV2PostOrchestrator", _fake_orchestrator_factory)
     return init_calls, orchestrators
 
 
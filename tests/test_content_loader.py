@@ -3,8 +3,9 @@
 import os
 import sys
 import tempfile
+from datetime import date
+from pathlib import Path
 from unittest import mock
-import frontmatter
 
 _SOURCE = os.path.join(os.path.dirname(__file__), "..", "_source")
 sys.path.insert(0, _SOURCE)
@@ -23,9 +24,8 @@ class TestParseMarkdownPost:
         try:
             # We use a dummy metadata store to avoid writing sidecar metadata
             store = {}
-            with mock.patch("content_loader.frontmatter.load") as mock_load:
-                post = frontmatter.Post("Content", title="Test")
-                mock_load.return_value = post
+            with mock.patch("content_loader.split_frontmatter") as mock_split:
+                mock_split.return_value = ({"title": "Test"}, "Content")
 
                 # We need to mock calculate_content_hash, which is from helpers
                 with mock.patch("content_loader.calculate_content_hash", return_value="hash"):
@@ -52,9 +52,8 @@ class TestParseMarkdownPost:
 
         try:
             store = {}
-            with mock.patch("content_loader.frontmatter.load") as mock_load:
-                post = frontmatter.Post("Content", title="Test", lang="pt-br")
-                mock_load.return_value = post
+            with mock.patch("content_loader.split_frontmatter") as mock_split:
+                mock_split.return_value = ({"title": "Test", "lang": "pt-br"}, "Content")
 
                 with mock.patch("content_loader.calculate_content_hash", return_value="hash"):
                     with mock.patch(
@@ -79,9 +78,8 @@ class TestParseMarkdownPost:
 
         try:
             store = {}
-            with mock.patch("content_loader.frontmatter.load") as mock_load:
-                post = frontmatter.Post("Content", title="Test", source_language="es-es")
-                mock_load.return_value = post
+            with mock.patch("content_loader.split_frontmatter") as mock_split:
+                mock_split.return_value = ({"title": "Test", "source_language": "es-es"}, "Content")
 
                 with mock.patch("content_loader.calculate_content_hash", return_value="hash"):
                     with mock.patch(
@@ -105,9 +103,8 @@ class TestParseMarkdownPost:
 
         try:
             store = {}
-            with mock.patch("content_loader.frontmatter.load") as mock_load:
-                post = frontmatter.Post("## Topic\n\nContent", title="Test")
-                mock_load.return_value = post
+            with mock.patch("content_loader.split_frontmatter") as mock_split:
+                mock_split.return_value = ({"title": "Test"}, "## Topic\n\nContent")
 
                 with mock.patch("content_loader.calculate_content_hash", return_value="hash"):
                     with mock.patch(
@@ -122,6 +119,226 @@ class TestParseMarkdownPost:
             mock_render.assert_called_once_with(
                 "## Topic\n\nContent",
                 source_markdown="## Topic\n\nContent",
+                nl2br=False,
             )
         finally:
             os.remove(filepath)
+
+    def test_source_file_is_opened_once(self, tmp_path):
+        source = tmp_path / "post.md"
+        source.write_text("---\ntitle: Test\ndate: 2024-01-15\n---\nContent", encoding="utf-8")
+        real_open = open
+        with mock.patch("builtins.open", side_effect=real_open) as opened:
+            content_loader.parse_markdown_post(source, _metadata_store={})
+        assert [call.args[0] for call in opened.call_args_list].count(source) == 1
+
+    def test_editorial_warnings_are_returned_not_printed(self, tmp_path, capsys):
+        source = tmp_path / "post.md"
+        source.write_text("---\ntitle: Test\n---\nContent", encoding="utf-8")
+        post = content_loader.parse_markdown_post(source, _metadata_store={})
+        assert capsys.readouterr().out == ""
+        assert post["_warnings"] == [
+            "'post' is missing frontmatter 'date' (publication date); defaulting to today"
+        ]
+
+    def test_source_file_is_never_rewritten(self, tmp_path):
+        source = tmp_path / "post.md"
+        source.write_text("---\ntitle: Test\ndate: 2024-01-15\n---\nContent", encoding="utf-8")
+        before = (source.read_bytes(), source.stat().st_mtime_ns)
+        store = {}
+        content_loader.parse_markdown_post(source, _metadata_store=store)
+        assert store["post"]["created_at"]  # timestamps live in the sidecar manifest
+        assert (source.read_bytes(), source.stat().st_mtime_ns) == before
+
+
+class TestSplitFrontmatter:
+    def test_splits_metadata_and_body(self):
+        meta, body = content_loader.split_frontmatter("---\ntitle: Test\ntags: [a, b]\n---\n\nBody\n")
+        assert meta == {"title": "Test", "tags": ["a", "b"]}
+        assert body == "Body"
+
+    def test_no_frontmatter(self):
+        assert content_loader.split_frontmatter("Just text") == ({}, "Just text")
+
+    def test_unclosed_frontmatter_is_body(self):
+        text = "---\ntitle: Test\nBody"
+        assert content_loader.split_frontmatter(text) == ({}, text)
+
+    def test_horizontal_rule_in_body_is_kept(self):
+        meta, body = content_loader.split_frontmatter("---\na: 1\n---\nOne\n\n---\n\nTwo")
+        assert meta == {"a": 1}
+        assert body == "One\n\n---\n\nTwo"
+
+
+class TestReadPostSource:
+    def test_reads_utf8_and_normalizes_newlines(self, tmp_path):
+        path = tmp_path / "post.md"
+        path.write_bytes("---\r\ntitle: Ol\u00e1\r\n---\r\nCora\u00e7\u00e3o\r".encode("utf-8"))
+        assert content_loader.read_post_source(path) == "---\ntitle: Ol\u00e1\n---\nCora\u00e7\u00e3o\n"
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.md"
+        path.write_bytes(b"")
+        assert content_loader.read_post_source(path) == ""
+
+
+class TestPostMetadataManifest:
+    def _roundtrip(self, monkeypatch, tmp_path, use_orjson):
+        monkeypatch.setattr(content_loader, "METADATA_FILE", tmp_path / "post-metadata.json")
+        if not use_orjson:
+            monkeypatch.setattr(content_loader, "orjson", None)
+        data = {"ensaio": {"content_hash": "abc", "created_at": "2024-01-01T00:00:00"}}
+        content_loader.save_post_metadata(data)
+        raw = (tmp_path / "post-metadata.json").read_text(encoding="utf-8")
+        assert '\n  "ensaio": {' in raw
+        assert content_loader.load_post_metadata() == data
+
+    def test_roundtrip_stdlib_json(self, monkeypatch, tmp_path):
+        self._roundtrip(monkeypatch, tmp_path, use_orjson=False)
+
+    def test_roundtrip_orjson_when_available(self, monkeypatch, tmp_path):
+        if content_loader.orjson is None:
+            import pytest
+
+            pytest.skip("orjson not installed")
+        self._roundtrip(monkeypatch, tmp_path, use_orjson=True)
+
+    def test_corrupt_manifest_returns_empty(self, monkeypatch, tmp_path):
+        path = tmp_path / "post-metadata.json"
+        path.write_text("{not json", encoding="utf-8")
+        monkeypatch.setattr(content_loader, "METADATA_FILE", path)
+        assert content_loader.load_post_metadata() == {}
+
+    def test_unchanged_manifest_is_not_rewritten(self, monkeypatch, tmp_path):
+        path = tmp_path / "post-metadata.json"
+        monkeypatch.setattr(content_loader, "METADATA_FILE", path)
+        content_loader.save_post_metadata({"a": {"content_hash": "1"}})
+        store = content_loader.load_post_metadata()
+        mtime = path.stat().st_mtime_ns
+        with mock.patch.object(type(path), "replace") as replace:
+            content_loader.save_post_metadata(store)
+            replace.assert_not_called()
+            store["a"]["content_hash"] = "2"
+            content_loader.save_post_metadata(store)
+            replace.assert_called_once()
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_failed_save_keeps_previous_manifest(self, monkeypatch, tmp_path):
+        path = tmp_path / "post-metadata.json"
+        monkeypatch.setattr(content_loader, "METADATA_FILE", path)
+        content_loader.save_post_metadata({"a": {"content_hash": "1"}})
+        before = path.read_bytes()
+        with mock.patch.object(type(path), "replace", side_effect=OSError("disk full")):
+            try:
+                content_loader.save_post_metadata({"a": {"content_hash": "2"}})
+            except OSError:
+                pass
+        assert path.read_bytes() == before
+
+
+class TestMarkdownRenderCache:
+    def test_nl2br_is_opt_in(self):
+        assert "<br />" not in content_loader.render_post_markdown("a\nb")
+        assert "a<br />\nb" in content_loader.render_post_markdown("a\nb", nl2br=True)
+
+    def test_disabled_by_default(self):
+        with mock.patch(
+            "content_loader.render_markdown_with_internal_refs", return_value="<p>x</p>"
+        ) as render:
+            content_loader.render_post_markdown("x")
+            content_loader.render_post_markdown("x")
+        assert render.call_count == 2
+
+    def test_hit_skips_rendering(self, tmp_path):
+        content_loader.configure_markdown_cache(tmp_path / "md")
+        try:
+            with mock.patch(
+                "content_loader.render_markdown_with_internal_refs", return_value="<p>x</p>"
+            ) as render:
+                assert content_loader.render_post_markdown("x") == "<p>x</p>"
+                assert content_loader.render_post_markdown("x") == "<p>x</p>"
+                content_loader.render_post_markdown("y")
+            assert render.call_count == 2
+        finally:
+            content_loader.configure_markdown_cache(None)
+
+    def test_clear_wipes_entries(self, tmp_path):
+        cache_dir = tmp_path / "md"
+        content_loader.configure_markdown_cache(cache_dir)
+        try:
+            content_loader.render_post_markdown("# Title")
+            assert list(cache_dir.glob("*.html"))
+            content_loader.configure_markdown_cache(cache_dir, clear=True)
+            assert not cache_dir.exists()
+        finally:
+            content_loader.configure_markdown_cache(None)
+
+
+class TestParsedPostCache:
+    @staticmethod
+    def _post(text, **fields):
+        return {"slug": "post", "_source_digest": content_loader._source_digest(text), **fields}
+
+    def test_roundtrip_until_source_changes(self, tmp_path):
+        source = tmp_path / "post.md"
+        source.write_text("---\ntitle: T\n---\nbody", encoding="utf-8")
+        store = {}
+        cache_dir = tmp_path / "parsed"
+        post = self._post("---\ntitle: T\n---\nbody", date=date(2024, 1, 15))
+
+        assert content_loader.load_cached_post(source, store, cache_dir) is None
+        content_loader.store_cached_post(source, post, store, cache_dir)
+        assert "post.md" in store[content_loader.PARSED_SOURCES_KEY]
+        assert content_loader.load_cached_post(source, store, cache_dir) == post
+
+        source.write_text("---\ntitle: T\n---\nedited body", encoding="utf-8")
+        assert content_loader.load_cached_post(source, store, cache_dir) is None
+
+    def test_touched_but_identical_source_is_a_hit(self, tmp_path):
+        source = tmp_path / "post.md"
+        source.write_text("body", encoding="utf-8")
+        store = {}
+        cache_dir = tmp_path / "parsed"
+        post = self._post("body")
+        content_loader.store_cached_post(source, post, store, cache_dir)
+        mtime = source.stat().st_mtime_ns + 10**9
+        os.utime(source, ns=(mtime, mtime))
+        assert content_loader.load_cached_post(source, store, cache_dir) == post
+        assert store[content_loader.PARSED_SOURCES_KEY]["post.md"][0] == mtime
+
+        source.write_text("edit", encoding="utf-8")  # same size, new content
+        assert content_loader.load_cached_post(source, store, cache_dir) is None
+
+    def test_missing_pickle_is_a_miss(self, tmp_path):
+        source = tmp_path / "post.md"
+        source.write_text("body", encoding="utf-8")
+        store = {}
+        cache_dir = tmp_path / "parsed"
+        content_loader.store_cached_post(source, self._post("body"), store, cache_dir)
+        (cache_dir / "post.pkl").unlink()
+        assert content_loader.load_cached_post(source, store, cache_dir) is None
+
+    def test_post_dated_by_the_build_clock_is_not_cached(self, tmp_path):
+        source = tmp_path / "post.md"
+        source.write_text("---\ntitle: T\n---\nbody", encoding="utf-8")
+        store = {}
+        cache_dir = tmp_path / "parsed"
+        post = content_loader.parse_markdown_post(source, _metadata_store=store)
+        content_loader.store_cached_post(source, post, store, cache_dir)
+        assert content_loader.load_cached_post(source, store, cache_dir) is None
+        assert not cache_dir.exists()
+
+    def test_dated_post_is_cached_without_reopening_its_source(self, tmp_path):
+        source = tmp_path / "post.md"
+        source.write_text("---\ntitle: T\ndate: 2024-01-15\n---\nbody", encoding="utf-8")
+        store = {}
+        cache_dir = tmp_path / "parsed"
+        real_open, real_read_bytes = open, Path.read_bytes
+        with mock.patch("builtins.open", side_effect=real_open) as opened, mock.patch.object(
+            Path, "read_bytes", autospec=True, side_effect=real_read_bytes
+        ) as read_bytes:
+            post = content_loader.parse_markdown_post(source, _metadata_store=store)
+            content_loader.store_cached_post(source, post, store, cache_dir)
+        assert [call.args[0] for call in opened.call_args_list].count(source) == 1
+        assert source not in [call.args[0] for call in read_bytes.call_args_list]
+        assert content_loader.load_cached_post(source, store, cache_dir) == post
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+import cv_parser
+
+_CV_YAML = """\
+name: Test Person
+tagline: Engineer
+location: Earth
+summary: Builds things.
+languages_spoken: [English]
+skills: [Python]
+contact: {email: a@b.c, linkedin: x, github: y}
+experience:
+  - {title: Engineer, company: Acme, period: 2020}
+education:
+  - {degree: BSc, school: Uni, period: 2016}
+"""
+
+
+def test_load_cv_data_reuses_validated_parse_until_file_changes(tmp_path, monkeypatch) -> None:
+    cv_file = tmp_path / "cv_data.yaml"
+    cv_file.write_text(_CV_YAML, encoding="utf-8")
+    monkeypatch.setattr(cv_parser, "CV_DATA_FILE", cv_file)
+    monkeypatch.setattr(cv_parser, "_cv_data_cache", {})
+
+    first = cv_parser.load_cv_data()
+    first["experience"][0]["title"] = "Mutated by caller"
+    with monkeypatch.context() as m:
+        m.setattr(cv_parser.yaml, "safe_load", lambda _f: pytest.fail("parsed again"))
+        second = cv_parser.load_cv_data()
+    assert second["experience"][0]["title"] == "Engineer"
+    assert second["experience"][0]["location"] == "Brazil"
+
+    cv_file.write_text(_CV_YAML.replace("Test Person", "Renamed"), encoding="utf-8")
+    mtime = cv_file.stat().st_mtime_ns + 10**9
+    os.utime(cv_file, ns=(mtime, mtime))
+    assert cv_parser.load_cv_data()["name"] == "Renamed"
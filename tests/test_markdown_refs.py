@@ -140,3 +140,17 @@ def test_render_does_not_inject_block_permalink_into_paragraph_wrapping_code_blo
     assert '<p class="linkable-block" data-block-id="block-002" id="block-002"><pre>' not in html
     assert '<pre class="linkable-block" data-block-id="block-002" id="block-002">' in html
     assert 'class="permalink-anchor block-anchor"' not in html
+
+
+def test_reused_renderer_does_not_leak_state_between_documents() -> None:
+    first = "## Alpha {#custom}\n\nSee [ref][1].\n\n[1]: https://example.com"
+    second = "## Beta\n\nPlain [ref][1] text."
+
+    expected_second = render_markdown_with_internal_refs(second)
+    render_markdown_with_internal_refs(first)
+    rendered_second = render_markdown_with_internal_refs(second)
+
+    assert rendered_second == expected_second
+    assert 'id="beta"' in rendered_second
+    assert "custom" not in rendered_second
+    assert "example.com" not in rendered_second
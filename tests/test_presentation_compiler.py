@@ -5,6 +5,7 @@ from presentation_compiler import (
     compile_presentation_markdown,
     presentation_document_from_dict,
     presentation_document_to_dict,
+    render_slide_markdown,
 )
 
 
@@ -154,3 +155,14 @@ One
 
     assert payload["slide_count"] == 1
     assert restored == document
+
+
+def test_reused_slide_renderer_does_not_leak_state_between_slides() -> None:
+    first = "See [ref][1].\n\n[1]: https://example.com"
+    second = "Plain [ref][1] text."
+
+    expected_second = render_slide_markdown(second)
+    render_slide_markdown(first)
+
+    assert render_slide_markdown(second) == expected_second
+    assert "example.com" not in expected_second
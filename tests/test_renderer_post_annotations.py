@@ -77,3 +77,25 @@ def test_generate_about_html_includes_sitewide_runtime_for_first_navigation() ->
     assert "/static/js/transitions.js" in html
     assert "/static/js/filter.js" in html
     assert "/static/js/annotations.js" in html
+
+
+def test_clear_render_caches_picks_up_edited_assets(tmp_path, monkeypatch) -> None:
+    import helpers
+    import renderer
+
+    monkeypatch.setattr(helpers, "PROJECT_ROOT", tmp_path)
+    sprite = tmp_path / "static" / "images" / "social-icons.svg"
+    sprite.parent.mkdir(parents=True)
+    sprite.write_text("<svg/>", encoding="utf-8")
+    renderer.clear_render_caches()
+    try:
+        before = renderer.render_footer("en")
+        sprite.write_text("<svg><symbol id='github'/></svg>", encoding="utf-8")
+        assert renderer.render_footer("en") == before
+
+        renderer.clear_render_caches()
+        after = renderer.render_footer("en")
+        assert after != before
+        assert f"social-icons.svg?v={helpers._asset_hash(renderer._SOCIAL_ICONS)}" in after
+    finally:
+        renderer.clear_render_caches()
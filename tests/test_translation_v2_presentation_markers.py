@@ -157,8 +157,8 @@ def test_build_validates_translated_presentation_markers_before_render(
     monkeypatch.setattr(build, "generate_index_html", lambda *a, **k: "<html>index</html>")
     monkeypatch.setattr(build, "generate_root_index", lambda: "<html>root</html>")
     monkeypatch.setattr(build, "generate_sitemap", lambda *a, **k: "<xml />")
-    monkeypatch.setattr(build, "validate_translation", lambda *a, **k: (True, []))
-    monkeypatch.setattr(build, "TranslationV2PostOrchestrator", lambda **_: _BadMarkerOrchestrator())
+    monkeypatch.setattr("translation_common.validate_translation", lambda *a, **k: (True, []))
+    monkeypatch.setattr("translation_v2.TranslationV2PostOrchestrator", lambda **_: _BadMarkerOrchestrator())
     monkeypatch.setattr(
         build,
         "generate_presentation_html",
@@ -4,6 +4,7 @@ import importlib
 import os
 import sys
 import types
+from unittest import mock
 
 
 # Make _source importable without installing package.
@@ -90,3 +91,92 @@ def test_translate_post_reuses_legacy_hash_cache_without_api_call():
     assert cache.stored
     assert cache.stored[-1][0] == slug
     assert cache.stored[-1][1] == new_hash
+
+
+def test_translate_post_hashes_source_once():
+    t = object.__new__(translator.MultiAgentTranslator)
+    t.cache = _FakeCache({})
+    hashed = []
+    original = t._calculate_hash
+    t._calculate_hash = lambda content: hashed.append(content) or original(content)
+    t._translate = lambda *args, **kwargs: None
+
+    t.translate_post("slug", {"title": "T"}, "body")
+
+    assert len([content for content in hashed if content.endswith("|en-us|pt-br")]) == 1
+
+
+def test_translation_cache_skips_identical_store(monkeypatch, tmp_path):
+    cache_file = tmp_path / "cache.json"
+    monkeypatch.setattr(translator, "TRANSLATION_CACHE_FILE", cache_file)
+    cache = translator.TranslationCache()
+    cache.store_translation("post", "h", {"content": "x"})
+    mtime = cache_file.stat().st_mtime_ns
+
+    with mock.patch.object(cache, "save") as save:
+        cache.store_translation("post", "h", {"content": "x"})
+        save.assert_not_called()
+        cache.store_translation("post", "h", {"content": "y"})
+        save.assert_called_once()
+
+    assert cache.unchanged_stores == 1
+    assert cache_file.stat().st_mtime_ns == mtime
+
+
+def test_translation_cache_file_is_the_same_with_or_without_orjson(monkeypatch, tmp_path):
+    cache_file = tmp_path / "cache.json"
+    monkeypatch.setattr(translator, "TRANSLATION_CACHE_FILE", cache_file)
+    translation = {"title": "Coração", "tags": ["um"], "content": "Olá\n\nmundo"}
+    outputs = []
+    for orjson_module in (translator.orjson, None):
+        monkeypatch.setattr(translator, "orjson", orjson_module)
+        cache = translator.TranslationCache()
+        cache.cache = {}
+        cache.store_translation("post", "h", translation)
+        outputs.append(cache_file.read_bytes())
+        assert translator.TranslationCache().cache["post"]["translation"] == translation
+
+    assert outputs[0] == outputs[1]
+
+
+def test_translation_cache_save_is_atomic(monkeypatch, tmp_path):
+    cache_file = tmp_path / "cache.json"
+    monkeypatch.setattr(translator, "TRANSLATION_CACHE_FILE", cache_file)
+    cache = translator.TranslationCache()
+    cache.store_translation("kept", "h", {"content": "x"})
+    before = cache_file.read_bytes()
+
+    cache.cache["broken"] = {"hash": "h", "translation": object()}
+    try:
+        cache.save()
+    except TypeError:
+        pass
+
+    assert cache_file.read_bytes() == before
+    assert set(translator.TranslationCache().cache) == {"kept"}
+
+
+def test_parse_response_reads_inline_and_standalone_sections():
+    t = object.__new__(translator.MultiAgentTranslator)
+    response = (
+        "OUTPUT:\ntitle: Titulo\nEXCERPT:\nResumo\nem duas linhas\n\nTAGS: um, dois\n"
+        "CONTENT:\n# Cabecalho\n\nCorpo\n"
+    )
+
+    parsed = t._parse_response(response, {"title": "T", "excerpt": "E", "tags": ["x"]})
+
+    assert parsed == {
+        "title": "Titulo",
+        "excerpt": "Resumo em duas linhas",
+        "tags": ["um", "dois"],
+        "content": "# Cabecalho\n\nCorpo",
+    }
+
+
+def test_parse_about_response_keeps_missing_paragraphs():
+    t = object.__new__(translator.MultiAgentTranslator)
+    original = {"title": "About", "p1": "one", "p2": "two", "p3": "three", "p4": "four"}
+
+    parsed = t._parse_about_response("TITLE:\nSobre\nP1:\num\nP3:\ntres\nfim", original)
+
+    assert parsed == {"title": "Sobre", "p1": "um", "p2": "two", "p3": "tres\nfim", "p4": "four"}
@@ -116,8 +116,7 @@ def configure_onefile_build(tmp_path: Path, monkeypatch, build_module, source_po
     monkeypatch.setattr(build_module, "save_post_metadata", lambda *_: None)
     monkeypatch.setattr(build_module, "load_cv_data", lambda: {"name": "x"})
     monkeypatch.setattr(
-        build_module,
-        "TranslationV2PostOrchestrator",
+        "translation_v2.TranslationV2PostOrchestrator",
         lambda **_: FakePostOrchestrator(
             run_id="test-run",
             artifact_run_dir=tmp_path / "_cache" / "translation-runs" / "test-run",